@@ -55,6 +55,8 @@ class ProfessionalProbabilityEngine:
             data = fetcher.get_robust_historical_data(symbol, period_days)
             
             if data is not None:
+                data = self._downcast_prices(data)
+                
                 # Use real current price if available
                 if current_price:
                     print(f"📊 Updating historical data with REAL current price: ${current_price:.2f}")
@@ -79,6 +81,16 @@ class ProfessionalProbabilityEngine:
         except Exception as e:
             print(f"❌ Error in get_real_market_data: {e}")
             return self._generate_realistic_mock_data(symbol)
+    
+    def _downcast_prices(self, df):
+        """Store OHLC columns as float32 - scoring does not need double precision
+        
+        Volume is left untouched: int32 can overflow on heavy-volume names and
+        cannot hold the NaNs some sources return.
+        """
+        price_cols = {col: 'float32' for col in ('Open', 'High', 'Low', 'Close') if col in df.columns}
+        return df.astype(price_cols) if price_cols else df
+    
     def _get_current_price_web_scraping(self, symbol):
         """Get current price using web scraping"""
         try:
@@ -159,6 +171,8 @@ class ProfessionalProbabilityEngine:
             'Volume': [random.randint(1000000, 50000000) for _ in prices]
         }, index=dates)
         
+        hist_data = self._downcast_prices(hist_data)
+        
         # Calculate returns
         hist_data['Returns'] = hist_data['Close'].pct_change()
         hist_data['Log_Returns'] = np.log(hist_data['Close'] / hist_data['Close'].shift(1))
@@ -269,6 +269,7 @@ except ImportError:
         def __init__(self): pass
         def filter_new_opportunities(self, opps): return opps
         def mark_ticket_as_sent(self, *args, **kwargs): pass
+        def mark_tickets_batch(self, tickets): return []
         def get_daily_stats(self): return {'total_sent': 0}
 
 # Add parent directory to path
@@ -1252,11 +1253,9 @@ class AutonomousSP500Scanner:
                         
                         # Analyze top candidates with unified brain (limit to 20 for performance)
                         top_candidates = filtered_tickers[:20]
-                        for ticker in top_candidates:
-                            unified_signal = unified_brain.analyze_symbol_unified(ticker)
-                            if unified_signal:
-                                unified_signals.append(unified_signal)
-                                nexus_speak("success", f"🧠 {ticker}: {unified_signal.unified_probability:.0f}% unified probability")
+                        for unified_signal in unified_brain.analyze_batch(top_candidates):
+                            unified_signals.append(unified_signal)
+                            nexus_speak("success", f"🧠 {unified_signal.symbol}: {unified_signal.unified_probability:.0f}% unified probability")
                         
                         # Send unified alerts immediately - these are the highest quality
                         if unified_signals:
@@ -1376,26 +1375,30 @@ class AutonomousSP500Scanner:
                     return self.run_daily_scan(max_analyze=max_analyze+100, min_opportunities=min_opportunities+2)
                 
                 # Track processed opportunities (alerts already sent via unified_messenger above)
+                sent_batch = []
                 for i, opp in enumerate(new_opportunities[:3], 1):  # Top 3 NEW signals
                     signal_data = opp['signal_data']
                     ticker = signal_data.get('ticker', 'UNKNOWN')
                     # Handle ticker dict case
                     ticker_symbol = ticker.get('ticker') if isinstance(ticker, dict) else ticker
                     
-                    # Mark ticket as sent (alert already sent by unified_messenger above)
-                    self.ticket_tracker.mark_ticket_as_sent(
-                        opp['symbol'], 
-                        opp['option_type'], 
-                        opp['strike'], 
-                        opp['expiry_date'],
-                        {
+                    # Queue ticket as sent (alert already sent by unified_messenger above)
+                    sent_batch.append({
+                        'symbol': opp['symbol'],
+                        'option_type': opp['option_type'],
+                        'strike': opp['strike'],
+                        'expiry_date': opp['expiry_date'],
+                        'additional_data': {
                             'probability': signal_data.get('probability', 0),
                             'quality_score': signal_data.get('signal_quality', signal_data.get('quality_score', 75))
                         }
-                    )
+                    })
                     
                     print(f"✅ NEW OPPORTUNITY #{i} PROCESSED: {ticker_symbol} {opp['option_type']} ${opp['strike']} - Alert sent via unified messenger")
                 
+                # One tracker write for the whole batch
+                self.ticket_tracker.mark_tickets_batch(sent_batch)
+                
                 # 7. Save results
                 self.save_daily_results()
                 
@@ -8,28 +8,105 @@ Combina: Earnings, PEAD, Technical, Probability Engine, Value/Glamour, Sentiment
 import sys
 import os
 import json
+import importlib
+import importlib.util
+import logging
+import string
+import threading
 import numpy as np
 import pandas as pd
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
+from functools import cached_property, lru_cache, wraps
 from typing import Dict, List, Optional, Tuple, Any
-import warnings
-warnings.filterwarnings('ignore')
+from cachetools import TTLCache
 
-# Import all Alpha Hunter components
-try:
-    from probability_engine_v2 import ProfessionalProbabilityEngine
-    from pead_strategy_core import PEADStrategyCore, PEADSignal
-    from earnings_analyzer_core import EarningsAnalyzerCore, EarningsData
-    from quantum_evolution_core import QuantumEvolutionCore
-    from markov_chain_analyzer import MarkovChainAnalyzer
-    UNIFIED_COMPONENTS_AVAILABLE = True
-    print("🧠 All Alpha Hunter components loaded successfully")
-except ImportError as e:
-    print(f"⚠️ Some components not available: {e}")
-    UNIFIED_COMPONENTS_AVAILABLE = False
+logger = logging.getLogger("alpha_hunter.brain")
 
-@dataclass
+# Alpha Hunter components pull in numpy/pandas/yfinance themselves, so only
+# locate them here; the engines are imported on first use
+UNIFIED_COMPONENTS_AVAILABLE = all(
+    importlib.util.find_spec(module) is not None
+    for module in ('probability_engine_v2', 'pead_strategy_core', 'earnings_analyzer_core',
+                   'quantum_evolution_core', 'markov_chain_analyzer'))
+if UNIFIED_COMPONENTS_AVAILABLE:
+    print("🧠 All Alpha Hunter components available")
+else:
+    print("⚠️ Some components not available")
+
+# Symbols analyzed at once by analyze_batch
+_MAX_SYMBOL_WORKERS = 8
+
+# Anchored to the repo root so every entry point shares one cache, whatever its CWD
+_CACHE_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), '.cache', 'brain')
+
+def _cacheable(result) -> bool:
+    """Empty lookups and {'error': ...} payloads are usually transient (rate limits,
+    network) and must not stick for the rest of the trading day"""
+    return bool(result) and not (isinstance(result, dict) and 'error' in result)
+
+def _disk_cached(ignore: List[str]):
+    """Memoize on disk with joblib when available; joblib is only loaded on
+    the first call"""
+    def decorator(func):
+        cached = None
+        
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            nonlocal cached
+            if cached is None:
+                try:
+                    from joblib import Memory
+                    cached = Memory(_CACHE_DIR, verbose=0).cache(func, ignore=ignore)
+                except ImportError:
+                    cached = func
+            result = cached(*args, **kwargs)
+            if cached is not func and not _cacheable(result):
+                # Already stored, so this only looks the entry up and drops it
+                cached.call_and_shelve(*args, **kwargs).clear()
+            return result
+        return wrapper
+    return decorator
+
+# Fundamentals-driven lookups only change quarterly, so memoize them on disk per
+# trading day; the engine argument is excluded from the cache key
+@_disk_cached(ignore=['pead_strategy'])
+def _classify_value_glamour(pead_strategy, symbols: List[str], trading_day: str):
+    return pead_strategy.classify_value_glamour(symbols)
+
+@_disk_cached(ignore=['markov_analyzer'])
+def _analyze_symbol_markov(markov_analyzer, symbol: str, trading_day: str):
+    return markov_analyzer.analyze_symbol_markov(symbol)
+
+def _finalize_signal(score_vec, weight_vec, thresholds, current_price):
+    """Unified probability, confidence bucket, primary strategy and trade levels.
+    
+    thresholds are descending (EXTREME..LOW); a bucket index equal to
+    len(thresholds) means the probability is below the LOW threshold.
+    """
+    unified_prob = (weight_vec * score_vec).sum()
+    conf_idx = np.searchsorted(-thresholds, -unified_prob)
+    primary_idx = np.argmax(score_vec)
+    
+    expected_return = min(unified_prob / 100 * 0.20, 0.25)  # Cap at 25% return
+    target_price = current_price * (1 + expected_return)
+    stop_loss = current_price * 0.95  # 5% stop loss
+    risk_reward = (target_price - current_price) / (current_price - stop_loss)
+    return unified_prob, conf_idx, primary_idx, target_price, stop_loss, risk_reward, expected_return
+
+@lru_cache(maxsize=None)
+def _signal_kernel():
+    """_finalize_signal JIT-compiled with Numba (cached on disk) when available,
+    plain NumPy otherwise; Numba is imported on first use only"""
+    try:
+        from numba import njit
+    except ImportError:
+        return _finalize_signal
+    return njit(cache=True)(_finalize_signal)
+
+@dataclass(frozen=True, slots=True)
 class UnifiedSignal:
     """Complete unified trading signal with all strategy inputs"""
     # Basic Info
@@ -71,50 +148,117 @@ class UnifiedSignal:
     signal_quality: float  # 0-100 overall quality
     urgency: str  # 'IMMEDIATE', 'SOON', 'MODERATE', 'PATIENT'
     
+# Unified alert layout, rendered with str.format_map in format_unified_alert
+_ALERT_TEMPLATE = """🧠 ALPHA HUNTER UNIFIED SIGNAL 🧠
+{confidence_level} CONFIDENCE - {urgency} PRIORITY
+
+TICKER: ${symbol}
+PROBABILITY: {unified_probability:.0f}%
+STRATEGY: {primary_strategy}
+
+RECOMMENDED ACTION:
+{contract_type}
+{contract_details}
+{catalyst_text}
+
+EXECUTION PLAN:
+BUY AT: ${entry_price:.2f}
+SELL TARGET: ${target_price:.2f} ({expected_return:.0%} profit)
+STOP LOSS: ${stop_loss:.2f}
+HOLD FOR: {holding_period} days maximum
+
+ENTRY CHECKLIST:
+1. Market open + volume > 50k
+2. Price confirms direction
+3. Set stop loss immediately
+4. Set profit target alert
+
+EXIT RULES:
+- Take profit at {expected_return:.0%} gain
+- Stop loss at 5% down
+- Close if no movement in {holding_period} days
+- Move stop to breakeven at 50% profit
+
+ANALYSIS:
+{strategy_count} strategies agree
+{primary_strategy} strategy is primary driver
+{unified_probability:.0f}% combined probability from all filters
+{confidence_level} confidence level
+
+PRIORITY: {urgency}
+"""
+
+# Contract recommendation per primary strategy: signal -> (contract_type, contract_details)
+def _resolve_technical(signal: 'UnifiedSignal') -> Tuple[str, str]:
+    return "PUTS - Technical Strategy", "Sell cash-secured puts at support level"
+
+def _resolve_earnings(signal: 'UnifiedSignal') -> Tuple[str, str]:
+    if not signal.earnings_catalyst:
+        return _resolve_technical(signal)
+    if signal.earnings_catalyst.get('days_to', 7) <= 3:
+        return "CALLS - Earnings Week Play", "Buy ATM calls expiring 2 weeks after earnings"
+    return "PUTS - Pre-earnings Positioning", "Sell cash-secured puts to collect premium"
+
+def _resolve_pead(signal: 'UnifiedSignal') -> Tuple[str, str]:
+    if not signal.pead_opportunity:
+        return _resolve_technical(signal)
+    if 'LONG' in signal.pead_opportunity.get('signal_type', 'LONG_VALUE'):
+        return "CALLS - PEAD Drift Play", "Buy slightly OTM calls, 45-day expiry"
+    return "PUTS - PEAD Drift Short", "Buy puts or short shares, 45-day target"
+
+# Strategies without an entry fall back to _resolve_technical
+_CONTRACT_RESOLVERS = {
+    'earnings': _resolve_earnings,
+    'pead': _resolve_pead,
+}
+
+# (literal, field, format_spec, conversion) runs of _ALERT_TEMPLATE for batch rendering
+_ALERT_SEGMENTS = list(string.Formatter().parse(_ALERT_TEMPLATE))
+
+def _format_column(column: 'pd.Series', spec: str) -> 'pd.Series':
+    """Column-wise equivalent of format(value, spec) for the template's specs"""
+    if not spec:
+        return column.astype(str)
+    if spec == '.0f':
+        # rint rounds half-to-even on the exact binary value, like format()
+        return column.round(0).astype('int64').astype(str)
+    # Scaled specs (.2f, .0%) would round differently after multiplying, so
+    # defer to format() itself for exact parity with the single-alert path
+    return column.map(('{:' + spec + '}').format)
+
 class UnifiedStrategyBrain:
     """Master brain that coordinates all Alpha Hunter strategies"""
     
-    def __init__(self):
-        print("🧠 INITIALIZING UNIFIED STRATEGY BRAIN")
-        print("="*50)
-        
-        # Initialize all components
-        self.prob_engine = None
-        self.pead_strategy = None
-        self.earnings_analyzer = None
-        self.quantum_core = None
-        self.markov_analyzer = None
+    # Fixed score vector layout shared by weights and component scores
+    _KEYS = ('technical', 'earnings', 'pead', 'sentiment', 'quantum', 'value_glamour', 'markov')
+    _KEY_INDEX = {key: i for i, key in enumerate(_KEYS)}
+    _CONFIDENCE_LEVELS = ('EXTREME', 'HIGH', 'MEDIUM', 'LOW')
+    
+    # Components whose runners don't cap their score at 100
+    _UNCAPPED_KEYS = frozenset({'quantum', 'markov'})
+    
+    # Component analyses fanned out per symbol, in start order: cheapest and
+    # most discriminating first, the full earnings scan last
+    # (score key, runner method name)
+    _COMPONENT_CALLS = [
+        ('markov', '_run_markov'),
+        ('value_glamour', '_run_value_glamour'),
+        ('technical', '_run_technical'),
+        ('quantum', '_run_quantum'),
+        ('pead', '_run_pead'),
+        ('earnings', '_run_earnings'),
+    ]
+    
+    def __init__(self, max_component_workers: Optional[int] = None):
+        """max_component_workers caps concurrent components per symbol; when it
+        is below the pipeline length the start order decides what runs first
+        and can be pruned away (default: all components at once)"""
+        logger.info("🧠 INITIALIZING UNIFIED STRATEGY BRAIN")
         
-        if UNIFIED_COMPONENTS_AVAILABLE:
-            try:
-                self.prob_engine = ProfessionalProbabilityEngine()
-                print("✅ Probability Engine loaded")
-            except Exception as e:
-                print(f"⚠️ Probability Engine failed: {e}")
-            
-            try:
-                self.pead_strategy = PEADStrategyCore()
-                print("✅ PEAD Strategy loaded")
-            except Exception as e:
-                print(f"⚠️ PEAD Strategy failed: {e}")
-            
-            try:
-                self.earnings_analyzer = EarningsAnalyzerCore()
-                print("✅ Earnings Analyzer loaded")
-            except Exception as e:
-                print(f"⚠️ Earnings Analyzer failed: {e}")
-            
-            try:
-                self.quantum_core = QuantumEvolutionCore()
-                print("✅ Quantum Core loaded")
-            except Exception as e:
-                print(f"⚠️ Quantum Core failed: {e}")
-            
-            try:
-                self.markov_analyzer = MarkovChainAnalyzer()
-                print("✅ Markov Analyzer loaded")
-            except Exception as e:
-                print(f"⚠️ Markov Analyzer failed: {e}")
+        # Market data memo keyed by (symbol, period) - shared by every
+        # component thread, so guard it with a lock
+        self._market_data_cache = TTLCache(maxsize=512, ttl=300)
+        self._market_data_lock = threading.Lock()
         
         # Unified scoring weights (must sum to 1.0)
         self.strategy_weights = {
@@ -127,6 +271,13 @@ class UnifiedStrategyBrain:
             'markov': 0.05         # 5% - Markov chain patterns
         }
         
+        # (score key, runner, weight) in start order
+        self._analysis_pipeline = [
+            (key, getattr(self, method_name), self.strategy_weights[key])
+            for key, method_name in self._COMPONENT_CALLS
+        ]
+        self.max_component_workers = max_component_workers or len(self._analysis_pipeline)
+        
         # Quality thresholds for unified signals
         self.quality_thresholds = {
             'EXTREME': 90,   # 90%+ unified probability
@@ -135,186 +286,329 @@ class UnifiedStrategyBrain:
             'LOW': 45        # 45-60% unified probability
         }
         
-        print(f"🎯 Strategy weights configured: {self.strategy_weights}")
-        print(f"🏆 Quality thresholds: {self.quality_thresholds}")
-        print("✅ Unified Strategy Brain ready!")
-    
-    def analyze_symbol_unified(self, symbol: str) -> Optional[UnifiedSignal]:
-        """Perform complete unified analysis of a symbol"""
-        print(f"\n🔍 UNIFIED ANALYSIS: {symbol}")
-        print("-" * 30)
+        logger.debug("🎯 Strategy weights configured: %s", self.strategy_weights)
+        logger.debug("🏆 Quality thresholds: %s", self.quality_thresholds)
+        logger.info("✅ Unified Strategy Brain ready!")
+    
+    # Scoring vectors are built on first analysis
+    @cached_property
+    def _weight_vec(self):
+        return np.fromiter((self.strategy_weights[k] for k in self._KEYS),
+                           dtype=np.float32, count=len(self._KEYS))
+    
+    @cached_property
+    def _threshold_vec(self):
+        return np.array([self.quality_thresholds[level] for level in self._CONFIDENCE_LEVELS],
+                        dtype=np.float32)
+    
+    # Component engines are imported and constructed lazily on first use; a
+    # failed or unavailable component is cached as None
+    def _load_component(self, module_name: str, class_name: str, label: str):
+        """Construct a component engine, returning None if it fails"""
+        try:
+            component = getattr(importlib.import_module(module_name), class_name)()
+            logger.debug("✅ %s loaded", label)
+            return component
+        except Exception as e:
+            logger.warning("⚠️ %s failed: %s", label, e)
+            return None
+    
+    @cached_property
+    def prob_engine(self):
+        if not UNIFIED_COMPONENTS_AVAILABLE:
+            return None
+        return self._load_component("probability_engine_v2", "ProfessionalProbabilityEngine", "Probability Engine")
+    
+    @cached_property
+    def pead_strategy(self):
+        if not UNIFIED_COMPONENTS_AVAILABLE:
+            return None
+        return self._load_component("pead_strategy_core", "PEADStrategyCore", "PEAD Strategy")
+    
+    @cached_property
+    def earnings_analyzer(self):
+        if not UNIFIED_COMPONENTS_AVAILABLE:
+            return None
+        return self._load_component("earnings_analyzer_core", "EarningsAnalyzerCore", "Earnings Analyzer")
+    
+    @cached_property
+    def quantum_core(self):
+        if not UNIFIED_COMPONENTS_AVAILABLE:
+            return None
+        return self._load_component("quantum_evolution_core", "QuantumEvolutionCore", "Quantum Core")
+    
+    @cached_property
+    def markov_analyzer(self):
+        if not UNIFIED_COMPONENTS_AVAILABLE:
+            return None
+        return self._load_component("markov_chain_analyzer", "MarkovChainAnalyzer", "Markov Analyzer")
+    
+    def _cached_market_data(self, symbol: str, period: str = '60d'):
+        """Fetch market data through the Probability Engine, memoized for 5 minutes"""
+        key = (symbol, period)
+        with self._market_data_lock:
+            data = self._market_data_cache.get(key)
+        if data is not None:
+            return data
         
-        # Initialize component scores
-        scores = {
-            'technical': 0,
-            'earnings': 0,
-            'pead': 0,
-            'sentiment': 0,
-            'quantum': 0,
-            'value_glamour': 0,
-            'markov': 0
-        }
+        # log/pct_change over flat or zero prices is expected to produce inf/NaN.
+        # np.errstate is per-thread, unlike warnings.catch_warnings, so it is
+        # safe inside the component fan-out
+        with np.errstate(divide='ignore', invalid='ignore'):
+            data = self.prob_engine.get_real_market_data(symbol, period=period)
+        with self._market_data_lock:
+            self._market_data_cache[key] = data
+        return data
+    
+    def _current_price(self, symbol: str) -> float:
+        """Latest price for trade levels, defaulting to 100 when unavailable"""
+        current_price = 100.0  # Default
+        try:
+            if self.prob_engine:
+                market_data = self._cached_market_data(symbol, '60d')
+                if market_data:
+                    price = market_data.get('current_price')
+                    if price is None:
+                        # Fall back to the last historical close (positional scalar access)
+                        history = market_data.get('historical_data')
+                        if history is not None and 'Close' in history.columns and len(history):
+                            price = history['Close'].iat[-1]
+                    if price is not None:
+                        current_price = float(price)
+        except Exception:
+            pass
+        return current_price
+    
+    def _run_technical(self, symbol: str) -> Optional[Tuple[float, str, Optional[Dict]]]:
+        """Technical analysis via the Probability Engine"""
+        if not self.prob_engine:
+            return None
+        data = self._cached_market_data(symbol, '60d')
+        if data is not None and len(data) > 20:
+            # Calculate technical probability
+            tech_prob = self.prob_engine.calculate_professional_probability(
+                symbol, 'put', 90, 30)
+            score = min(tech_prob, 100)
+            logger.debug("📊 %s Technical Score: %.1f%%", symbol, score)
+            return score, 'Technical Analysis', None
+        return None
+    
+    def _build_earnings_index(self) -> Dict[str, Any]:
+        """Fetch the upcoming earnings calendar once and index it by symbol"""
+        earnings_analysis = self.earnings_analyzer.run_comprehensive_earnings_analysis(days_ahead=14)
+        earnings_index = {}
+        for earnings_data in earnings_analysis.get('earnings_list', []):
+            # First entry wins, matching the old linear scan
+            earnings_index.setdefault(earnings_data.symbol.upper(), earnings_data)
+        return earnings_index
+    
+    def _run_earnings(self, symbol: str,
+                      earnings_index: Optional[Dict[str, Any]] = None) -> Optional[Tuple[float, str, Optional[Dict]]]:
+        """Earnings catalyst analysis"""
+        if not self.earnings_analyzer:
+            return None
+        if earnings_index is None:
+            earnings_index = self._build_earnings_index()
+        
+        earnings_data = earnings_index.get(symbol.upper())
+        if earnings_data:
+            # Score based on proximity and sentiment
+            days_to_earnings = earnings_data.days_to_earnings
+            sentiment = earnings_data.sentiment_score
+            
+            if days_to_earnings <= 7:  # Within a week
+                base_score = 80  # High base for near-term earnings
+                sentiment_bonus = (sentiment - 50) * 0.4  # Scale sentiment
+                score = min(base_score + sentiment_bonus, 100)
+                
+                catalyst = {
+                    'date': earnings_data.earnings_date,
+                    'days_to': days_to_earnings,
+                    'sentiment': sentiment
+                }
+                logger.debug("📅 %s Earnings Score: %.1f%% (in %s days)", symbol, score, days_to_earnings)
+                return score, 'Earnings Catalyst', catalyst
+        return None
+    
+    def _run_pead(self, symbol: str,
+                  pead_index: Optional[Dict[str, Any]] = None) -> Optional[Tuple[float, str, Optional[Dict]]]:
+        """Post-earnings-announcement drift analysis"""
+        if not self.pead_strategy:
+            return None
+        if pead_index is None:
+            pead_signals = self.pead_strategy.generate_pead_signals([symbol])
+            pead_signal = pead_signals[0] if pead_signals else None
+        else:
+            pead_signal = pead_index.get(symbol)
+        if pead_signal:
+            score = min(pead_signal.confidence * 100, 100)
+            
+            catalyst = {
+                'signal_type': pead_signal.signal_type,
+                'expected_return': pead_signal.expected_return,
+                'surprise_percent': pead_signal.earnings_surprise.surprise_percent
+            }
+            logger.debug("🎯 %s PEAD Score: %.1f%%", symbol, score)
+            return score, 'PEAD Strategy', catalyst
+        return None
+    
+    def _run_quantum(self, symbol: str) -> Optional[Tuple[float, str, Optional[Dict]]]:
+        """Quantum evolution analysis based on market patterns"""
+        if not self.quantum_core:
+            return None
+        quantum_result = self.quantum_core.analyze_symbol_quantum(symbol)
+        if quantum_result:
+            score = quantum_result.get('probability', 0)
+            logger.debug("⚡ %s Quantum Score: %.1f%%", symbol, score)
+            return score, 'Quantum Evolution', None
+        return None
+    
+    def _run_value_glamour(self, symbol: str,
+                           classifications: Optional[Dict[str, Any]] = None) -> Optional[Tuple[float, str, Optional[Dict]]]:
+        """Value vs Glamour classification"""
+        if classifications is None:
+            classifications = (_classify_value_glamour(self.pead_strategy, [symbol], date.today().isoformat())
+                               if self.pead_strategy else {})
+        classification = classifications.get(symbol)
+        if classification:
+            # Score based on classification quality
+            base_score = 60 if classification.classification == 'VALUE' else 40
+            confidence_bonus = classification.confidence_score * 20
+            score = min(base_score + confidence_bonus, 100)
+            logger.debug("💎 %s Value/Glamour Score: %.1f%% (%s)", symbol, score, classification.classification)
+            return score, 'Value/Glamour Analysis', None
+        return None
+    
+    def _run_markov(self, symbol: str) -> Optional[Tuple[float, str, Optional[Dict]]]:
+        """Markov chain transition analysis"""
+        if not self.markov_analyzer:
+            return None
+        markov_result = _analyze_symbol_markov(self.markov_analyzer, symbol, date.today().isoformat())
+        if markov_result:
+            score = markov_result.get('transition_probability', 0) * 100
+            logger.debug("🔗 %s Markov Score: %.1f%%", symbol, score)
+            return score, 'Markov Chain', None
+        return None
+    
+    def analyze_symbol_unified(self, symbol: str,
+                               earnings_index: Optional[Dict[str, Any]] = None,
+                               pead_index: Optional[Dict[str, Any]] = None,
+                               value_glamour_index: Optional[Dict[str, Any]] = None,
+                               timestamp: Optional[str] = None) -> Optional[UnifiedSignal]:
+        """Perform complete unified analysis of a symbol
+        
+        The optional indices are batch-wide lookups prepared by analyze_batch;
+        when omitted each component fetches its own data for this symbol.
+        timestamp stamps the signal (default: now).
+        """
+        logger.debug("🔍 UNIFIED ANALYSIS: %s", symbol)
+        
+        # Component scores, laid out as self._KEYS
+        score_vec = np.zeros(len(self._KEYS), dtype=np.float32)
         
         contributing_strategies = []
         catalysts = {}
         
         try:
-            # 1. TECHNICAL ANALYSIS (via Probability Engine)
-            if self.prob_engine:
-                try:
-                    data = self.prob_engine.get_real_market_data(symbol, period='60d')
-                    if data is not None and len(data) > 20:
-                        # Calculate technical probability
-                        tech_prob = self.prob_engine.calculate_professional_probability(
-                            symbol, 'put', 90, 30)
-                        scores['technical'] = min(tech_prob, 100)
-                        contributing_strategies.append('Technical Analysis')
-                        print(f"📊 Technical Score: {scores['technical']:.1f}%")
-                except Exception as e:
-                    print(f"⚠️ Technical analysis failed: {e}")
-            
-            # 2. EARNINGS ANALYSIS
-            if self.earnings_analyzer:
-                try:
-                    earnings_analysis = self.earnings_analyzer.run_comprehensive_earnings_analysis(days_ahead=14)
-                    earnings_list = earnings_analysis.get('earnings_list', [])
-                    
-                    for earnings_data in earnings_list:
-                        if earnings_data.symbol.upper() == symbol.upper():
-                            # Score based on proximity and sentiment
-                            days_to_earnings = earnings_data.days_to_earnings
-                            sentiment = getattr(earnings_data, 'sentiment_score', 50)
-                            
-                            if days_to_earnings <= 7:  # Within a week
-                                base_score = 80  # High base for near-term earnings
-                                sentiment_bonus = (sentiment - 50) * 0.4  # Scale sentiment
-                                scores['earnings'] = min(base_score + sentiment_bonus, 100)
-                                
-                                catalysts['earnings'] = {
-                                    'date': earnings_data.earnings_date,
-                                    'days_to': days_to_earnings,
-                                    'sentiment': sentiment
-                                }
-                                contributing_strategies.append('Earnings Catalyst')
-                                print(f"📅 Earnings Score: {scores['earnings']:.1f}% (in {days_to_earnings} days)")
-                            break
-                except Exception as e:
-                    print(f"⚠️ Earnings analysis failed: {e}")
-            
-            # 3. PEAD ANALYSIS
-            if self.pead_strategy:
-                try:
-                    pead_signals = self.pead_strategy.generate_pead_signals([symbol])
-                    if pead_signals:
-                        pead_signal = pead_signals[0]
-                        scores['pead'] = min(pead_signal.confidence * 100, 100)
-                        
-                        catalysts['pead'] = {
-                            'signal_type': pead_signal.signal_type,
-                            'expected_return': pead_signal.expected_return,
-                            'surprise_percent': pead_signal.earnings_surprise.surprise_percent
-                        }
-                        contributing_strategies.append('PEAD Strategy')
-                        print(f"🎯 PEAD Score: {scores['pead']:.1f}%")
-                except Exception as e:
-                    print(f"⚠️ PEAD analysis failed: {e}")
-            
-            # 4. SENTIMENT ANALYSIS (from earnings analyzer)
-            # Already captured in earnings analysis
-            
-            # 5. QUANTUM EVOLUTION ANALYSIS
-            if self.quantum_core:
-                try:
-                    # Quantum analysis based on market patterns
-                    quantum_result = self.quantum_core.analyze_symbol_quantum(symbol)
-                    if quantum_result:
-                        scores['quantum'] = quantum_result.get('probability', 0)
-                        contributing_strategies.append('Quantum Evolution')
-                        print(f"⚡ Quantum Score: {scores['quantum']:.1f}%")
-                except Exception as e:
-                    print(f"⚠️ Quantum analysis failed: {e}")
-            
-            # 6. VALUE/GLAMOUR CLASSIFICATION
+            # Every component is I/O-bound and independent, so fan them out
+            # concurrently and collect the results into the score vector.
+            # (Sentiment is already captured in the earnings analysis.)
+            batch_indices = {
+                'earnings': earnings_index,
+                'pead': pead_index,
+                'value_glamour': value_glamour_index
+            }
+            results = {}
+            executor = ThreadPoolExecutor(max_workers=self.max_component_workers)
             try:
-                classifications = self.pead_strategy.classify_value_glamour([symbol]) if self.pead_strategy else {}
-                classification = classifications.get(symbol)
-                if classification:
-                    # Score based on classification quality
-                    base_score = 60 if classification.classification == 'VALUE' else 40
-                    confidence_bonus = classification.confidence_score * 20
-                    scores['value_glamour'] = min(base_score + confidence_bonus, 100)
-                    contributing_strategies.append('Value/Glamour Analysis')
-                    print(f"💎 Value/Glamour Score: {scores['value_glamour']:.1f}% ({classification.classification})")
-            except Exception as e:
-                print(f"⚠️ Value/Glamour analysis failed: {e}")
+                futures = {}
+                for key, runner, weight in self._analysis_pipeline:
+                    args = (symbol,) if batch_indices.get(key) is None else (symbol, batch_indices[key])
+                    futures[executor.submit(runner, *args)] = (key, weight)
+                
+                # Upper bound on the unified probability: what has been scored so far
+                # plus a perfect 100 from every capped component still running.
+                # Uncapped components have no bound, so nothing is pruned while
+                # one of them is pending
+                low_threshold = self.quality_thresholds['LOW']
+                achieved = 0.0
+                pending_max = sum(weight * 100 for key, weight in futures.values()
+                                  if key not in self._UNCAPPED_KEYS)
+                unbounded_pending = sum(key in self._UNCAPPED_KEYS for key, _ in futures.values())
+                
+                for future in as_completed(futures):
+                    key, weight = futures[future]
+                    try:
+                        results[key] = future.result()
+                    except Exception as e:
+                        logger.warning("⚠️ %s %s analysis failed: %s", symbol, key, e)
+                    
+                    if key in self._UNCAPPED_KEYS:
+                        unbounded_pending -= 1
+                    else:
+                        pending_max -= weight * 100
+                    if results.get(key):
+                        achieved += weight * results[key][0]
+                    if not unbounded_pending and achieved + pending_max < low_threshold:
+                        logger.debug("✂️ %s pruned: at most %.1f%% reachable (< %s%%)",
+                                     symbol, achieved + pending_max, low_threshold)
+                        return None
+            finally:
+                # Don't wait on components whose result can no longer matter
+                executor.shutdown(wait=False, cancel_futures=True)
             
-            # 7. MARKOV CHAIN ANALYSIS
-            if self.markov_analyzer:
-                try:
-                    markov_result = self.markov_analyzer.analyze_symbol_markov(symbol)
-                    if markov_result:
-                        scores['markov'] = markov_result.get('transition_probability', 0) * 100
-                        contributing_strategies.append('Markov Chain')
-                        print(f"🔗 Markov Score: {scores['markov']:.1f}%")
-                except Exception as e:
-                    print(f"⚠️ Markov analysis failed: {e}")
+            # Merge in score-vector order so contributing strategies stay deterministic
+            for i, key in enumerate(self._KEYS):
+                result = results.get(key)
+                if result:
+                    score, strategy_name, catalyst = result
+                    score_vec[i] = score
+                    contributing_strategies.append(strategy_name)
+                    if catalyst:
+                        catalysts[key] = catalyst
             
-            # CALCULATE UNIFIED PROBABILITY
-            unified_prob = sum(scores[key] * self.strategy_weights[key] 
-                             for key in scores.keys())
+            # Get real current price (served from the technical pass's cached fetch)
+            current_price = self._current_price(symbol)
             
-            print(f"\n🧠 UNIFIED PROBABILITY: {unified_prob:.1f}%")
+            # CALCULATE UNIFIED PROBABILITY and trading parameters in one compiled pass
+            (unified_prob, conf_idx, primary_idx, target_price, stop_loss,
+             risk_reward, expected_return) = _signal_kernel()(
+                score_vec, self._weight_vec, self._threshold_vec, current_price)
+            unified_prob = float(unified_prob)
             
-            # Determine confidence level
-            if unified_prob >= self.quality_thresholds['EXTREME']:
-                confidence = 'EXTREME'
-            elif unified_prob >= self.quality_thresholds['HIGH']:
-                confidence = 'HIGH'
-            elif unified_prob >= self.quality_thresholds['MEDIUM']:
-                confidence = 'MEDIUM'
-            else:
-                confidence = 'LOW'
+            logger.info("🧠 %s UNIFIED PROBABILITY: %.1f%%", symbol, unified_prob)
             
-            # Only generate signals for MEDIUM or higher
-            if unified_prob >= self.quality_thresholds['LOW']:
-                # Determine primary strategy (highest contributing score)
-                primary_strategy = max(scores.keys(), key=lambda k: scores[k])
-                
-                # Get real current price
-                current_price = 100  # Default
-                try:
-                    if self.prob_engine:
-                        market_data = self.prob_engine.get_real_market_data(symbol, period='5d')
-                        if market_data is not None and len(market_data) > 0:
-                            current_price = market_data.get('Close', pd.Series([100])).iloc[-1]
-                except Exception:
-                    pass
+            # Only generate signals for LOW or higher (bucket past the last threshold)
+            confidence_levels = self._CONFIDENCE_LEVELS
+            if conf_idx < len(confidence_levels):
+                confidence = confidence_levels[conf_idx]
+                # Primary strategy is the highest contributing score
+                primary_strategy = self._KEYS[primary_idx]
                 
-                # Calculate trading parameters based on unified probability
-                expected_return = min(unified_prob / 100 * 0.20, 0.25)  # Cap at 25% return
-                target_price = current_price * (1 + expected_return)
-                stop_loss = current_price * 0.95  # 5% stop loss
+                # One C-level conversion instead of seven numpy scalar lookups
+                (technical, earnings, pead, sentiment,
+                 quantum, value_glamour, markov) = score_vec.tolist()
                 
                 unified_signal = UnifiedSignal(
                     symbol=symbol,
-                    timestamp=datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                    timestamp=timestamp or datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
                     unified_probability=unified_prob,
                     confidence_level=confidence,
-                    technical_score=scores['technical'],
-                    earnings_score=scores['earnings'],
-                    pead_score=scores['pead'],
-                    sentiment_score=scores['sentiment'],
-                    quantum_score=scores['quantum'],
-                    value_glamour_score=scores['value_glamour'],
-                    markov_score=scores['markov'],
+                    technical_score=technical,
+                    earnings_score=earnings,
+                    pead_score=pead,
+                    sentiment_score=sentiment,
+                    quantum_score=quantum,
+                    value_glamour_score=value_glamour,
+                    markov_score=markov,
                     primary_strategy=primary_strategy,
                     contributing_strategies=contributing_strategies,
                     entry_price=current_price,
-                    target_price=target_price,
-                    stop_loss=stop_loss,
-                    expected_return=expected_return,
+                    target_price=float(target_price),
+                    stop_loss=float(stop_loss),
+                    expected_return=float(expected_return),
                     holding_period=30,  # Default 30 days
-                    risk_reward_ratio=(target_price - current_price) / (current_price - stop_loss),
+                    risk_reward_ratio=float(risk_reward),
                     earnings_catalyst=catalysts.get('earnings'),
                     pead_opportunity=catalysts.get('pead'),
                     technical_patterns=[],  # Would be populated from technical analysis
@@ -323,40 +617,71 @@ class UnifiedStrategyBrain:
                     urgency='IMMEDIATE' if unified_prob > 85 else 'SOON' if unified_prob > 70 else 'MODERATE'
                 )
                 
-                print(f"✅ UNIFIED SIGNAL GENERATED: {confidence} confidence")
+                logger.info("✅ %s UNIFIED SIGNAL GENERATED: %s confidence", symbol, confidence)
                 return unified_signal
             
             else:
-                print(f"⚠️ Signal below threshold ({unified_prob:.1f}% < {self.quality_thresholds['LOW']}%)")
+                logger.debug("⚠️ %s signal below threshold (%.1f%% < %s%%)",
+                             symbol, unified_prob, self.quality_thresholds['LOW'])
                 return None
                 
         except Exception as e:
-            print(f"❌ Unified analysis failed for {symbol}: {e}")
+            logger.error("❌ Unified analysis failed for %s: %s", symbol, e)
             return None
     
-    def format_unified_alert(self, signal: UnifiedSignal) -> str:
-        """Format unified signal into clean, executable alert"""
+    def analyze_batch(self, symbols: List[str]) -> List[UnifiedSignal]:
+        """Analyze many symbols, sharing the batch-wide earnings/PEAD/value lookups"""
+        if not symbols:
+            return []
+        logger.info("🧠 UNIFIED BATCH ANALYSIS: %d symbols", len(symbols))
+        
+        earnings_index = None
+        pead_index = None
+        value_glamour_index = None
+        
+        if self.earnings_analyzer:
+            try:
+                earnings_index = self._build_earnings_index()
+            except Exception as e:
+                logger.warning("⚠️ Batch earnings analysis failed: %s", e)
+        
+        if self.pead_strategy:
+            try:
+                value_glamour_index = _classify_value_glamour(self.pead_strategy, symbols, date.today().isoformat())
+            except Exception as e:
+                logger.warning("⚠️ Batch Value/Glamour analysis failed: %s", e)
+            
+            try:
+                pead_index = {}
+                for pead_signal in self.pead_strategy.generate_pead_signals(symbols):
+                    pead_index.setdefault(pead_signal.symbol, pead_signal)
+            except Exception as e:
+                pead_index = None
+                logger.warning("⚠️ Batch PEAD analysis failed: %s", e)
+        
+        # One timestamp for the whole batch
+        batch_ts = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        
+        def analyze(symbol: str) -> Optional[UnifiedSignal]:
+            return self.analyze_symbol_unified(
+                symbol,
+                earnings_index=earnings_index,
+                pead_index=pead_index,
+                value_glamour_index=value_glamour_index,
+                timestamp=batch_ts)
+        
+        # Symbols are analyzed concurrently - the work is dominated by network I/O.
+        # Each symbol fans out to its own component pool, so keep the outer level small
+        with ThreadPoolExecutor(max_workers=min(_MAX_SYMBOL_WORKERS, len(symbols))) as pool:
+            signals = list(pool.map(analyze, symbols))
+        return [signal for signal in signals if signal]
+    
+    def _alert_context(self, signal: UnifiedSignal) -> Dict[str, Any]:
+        """Placeholder values for _ALERT_TEMPLATE"""
         
         # Determine optimal contract type based on primary strategy
-        if signal.primary_strategy == 'earnings' and signal.earnings_catalyst:
-            days_to_earnings = signal.earnings_catalyst.get('days_to', 7)
-            if days_to_earnings <= 3:
-                contract_type = "CALLS - Earnings Week Play"
-                contract_details = f"Buy ATM calls expiring 2 weeks after earnings"
-            else:
-                contract_type = "PUTS - Pre-earnings Positioning"  
-                contract_details = f"Sell cash-secured puts to collect premium"
-        elif signal.primary_strategy == 'pead' and signal.pead_opportunity:
-            pead_type = signal.pead_opportunity.get('signal_type', 'LONG_VALUE')
-            if 'LONG' in pead_type:
-                contract_type = "CALLS - PEAD Drift Play"
-                contract_details = f"Buy slightly OTM calls, 45-day expiry"
-            else:
-                contract_type = "PUTS - PEAD Drift Short"
-                contract_details = f"Buy puts or short shares, 45-day target"
-        else:
-            contract_type = "PUTS - Technical Strategy"
-            contract_details = f"Sell cash-secured puts at support level"
+        resolver = _CONTRACT_RESOLVERS.get(signal.primary_strategy, _resolve_technical)
+        contract_type, contract_details = resolver(signal)
         
         # Create catalyst section
         catalyst_text = ""
@@ -370,63 +695,48 @@ class UnifiedStrategyBrain:
             surprise = signal.pead_opportunity.get('surprise_percent', 0)
             catalyst_text += f"\nPEAD OPPORTUNITY: {pead_type} after {surprise:+.1f}% earnings surprise"
         
-        # Execution steps
-        entry_process = f"""
-ENTRY PROCESS:
-1. Wait for market open confirmation
-2. Check volume > 50k in first 30 minutes
-3. Enter position when price confirms direction
-4. Set alerts for all exit levels immediately
-
-EXIT STRATEGY:
-- TAKE PROFIT: {signal.expected_return:.0%} target ({signal.urgency} urgency)
-- STOP LOSS: 5% maximum loss from entry
-- TIME STOP: Close before {signal.holding_period} days if no movement
-- PROFIT PROTECTION: Move stop to breakeven at 50% of target
-"""
-
-        alert = f"""🧠 ALPHA HUNTER UNIFIED SIGNAL 🧠
-{signal.confidence_level} CONFIDENCE - {signal.urgency} PRIORITY
-
-TICKER: ${signal.symbol}
-PROBABILITY: {signal.unified_probability:.0f}%
-STRATEGY: {signal.primary_strategy.upper()}
-
-RECOMMENDED ACTION:
-{contract_type}
-{contract_details}
-{catalyst_text}
-
-EXECUTION PLAN:
-BUY AT: ${signal.entry_price:.2f}
-SELL TARGET: ${signal.target_price:.2f} ({signal.expected_return:.0%} profit)
-STOP LOSS: ${signal.stop_loss:.2f}
-HOLD FOR: {signal.holding_period} days maximum
-
-ENTRY CHECKLIST:
-1. Market open + volume > 50k
-2. Price confirms direction
-3. Set stop loss immediately
-4. Set profit target alert
-
-EXIT RULES:
-- Take profit at {signal.expected_return:.0%} gain
-- Stop loss at 5% down
-- Close if no movement in {signal.holding_period} days
-- Move stop to breakeven at 50% profit
-
-ANALYSIS:
-{len(signal.contributing_strategies)} strategies agree
-{signal.primary_strategy.upper()} strategy is primary driver
-{signal.unified_probability:.0f}% combined probability from all filters
-{signal.confidence_level} confidence level
-
-PRIORITY: {signal.urgency}
-"""
-        return alert
+        return {
+            'symbol': signal.symbol,
+            'confidence_level': signal.confidence_level,
+            'urgency': signal.urgency,
+            'unified_probability': signal.unified_probability,
+            'primary_strategy': signal.primary_strategy.upper(),
+            'contract_type': contract_type,
+            'contract_details': contract_details,
+            'catalyst_text': catalyst_text,
+            'entry_price': signal.entry_price,
+            'target_price': signal.target_price,
+            'stop_loss': signal.stop_loss,
+            'expected_return': signal.expected_return,
+            'holding_period': signal.holding_period,
+            'strategy_count': len(signal.contributing_strategies)
+        }
+    
+    def format_unified_alert(self, signal: UnifiedSignal) -> str:
+        """Format unified signal into clean, executable alert"""
+        return _ALERT_TEMPLATE.format_map(self._alert_context(signal))
+    
+    def format_alerts_batch(self, signals: List[UnifiedSignal]) -> 'pd.Series':
+        """Format many unified signals at once (e.g. a daily digest)
+        
+        Renders the same _ALERT_TEMPLATE as format_unified_alert, but as
+        column-wise pandas string operations over all signals.
+        """
+        if not signals:
+            return pd.Series([], dtype=object)
+        
+        df = pd.DataFrame([self._alert_context(signal) for signal in signals])
+        alerts = pd.Series('', index=df.index, dtype=object)
+        for literal, field, spec, _ in _ALERT_SEGMENTS:
+            if literal:
+                alerts = alerts + literal
+            if field is not None:
+                alerts = alerts + _format_column(df[field], spec)
+        return alerts
 
 # Test the unified brain
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     print("🧠 TESTING UNIFIED STRATEGY BRAIN")
     print("="*50)
     
@@ -435,9 +745,10 @@ if __name__ == "__main__":
     # Test symbols
     test_symbols = ['AAPL', 'NVDA', 'TSLA']
     
+    signals = {signal.symbol: signal for signal in brain.analyze_batch(test_symbols)}
+    
     for symbol in test_symbols:
-        signal = brain.analyze_symbol_unified(symbol)
-        
+        signal = signals.get(symbol)
         if signal:
             alert = brain.format_unified_alert(signal)
             print("\n" + "="*80)
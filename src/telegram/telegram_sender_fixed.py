@@ -6,21 +6,36 @@ Formato limpio sin errores de parsing
 
 import sys
 import os
+import asyncio
+import logging
+import aiohttp
 import requests
 from datetime import datetime
-from safe_send_utility import safe_telegram_send, safe_send, get_safe_send_stats
+from functools import lru_cache
+from safe_send_utility import safe_telegram_send, safe_telegram_send_async, safe_send, get_safe_send_stats
 
 # Add parent directory to path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 try:
-    from utils.nexus_utils import nexus_speak  
+    from utils.nexus_utils import nexus_speak, cached_strftime
 except ImportError:
     def nexus_speak(level, message):
         print(f"[{level.upper()}] {message}")
+    
+    def cached_strftime(fmt='%H:%M:%S'):
+        return datetime.now().strftime(fmt)
 
 from alpha_hunter_v2_unified import AlphaHunterV2Professional
 
+logger = logging.getLogger("alpha_hunter.telegram")
+
+# Credentials resolved once at import. The chat id stays a string: Telegram
+# takes numeric ids and @channel usernames alike in the JSON payload
+_BOT_TOKEN = os.getenv("TELEGRAM_BOT_TOKEN")
+_CHAT_ID = os.getenv("TELEGRAM_CHAT_ID")
+_URL = f"https://api.telegram.org/bot{_BOT_TOKEN}/sendMessage"
+
 def clean_telegram_message(message):
     """Clean message for Telegram - remove problematic markdown"""
     # Remove problematic markdown characters
@@ -37,35 +52,34 @@ def clean_telegram_message(message):
 def send_clean_telegram(message, chat_id=None):
     """Send clean message to Telegram"""
     try:
-        # Use environment variables
-        bot_token = os.getenv("TELEGRAM_BOT_TOKEN")
-        chat_id_str = chat_id or os.getenv("TELEGRAM_CHAT_ID")
-        chat_id_int = int(chat_id_str)  # Convert to integer
-        url = f"https://api.telegram.org/bot{bot_token}/sendMessage"
+        chat_id = chat_id or _CHAT_ID
+        if not _BOT_TOKEN or not chat_id:
+            logger.error("Telegram credentials not configured")
+            return False
         
         # Clean message
         clean_msg = clean_telegram_message(message)
         
         payload = {
-            "chat_id": chat_id_int,
+            "chat_id": chat_id,
             "text": clean_msg
         }
         
         # REFACTORED: Use safe_telegram_send with BrokenPipeError tolerance
-        success = safe_telegram_send(url, payload, timeout=10)
+        success = safe_telegram_send(_URL, payload, timeout=10)
         
         if success:
-            nexus_speak("success", "✅ Telegram message sent successfully via safe_send!")
+            logger.info("Telegram message sent successfully via safe_send")
             return True
         else:
-            nexus_speak("error", "❌ Telegram send failed after retries")
+            logger.error("Telegram send failed after retries")
             # Log stats for debugging
-            stats = get_safe_send_stats()
-            nexus_speak("info", f"📊 Safe Send Stats: {stats['success_rate']} success rate")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Safe Send Stats: %s success rate", get_safe_send_stats()['success_rate'])
             return False
             
     except Exception as e:
-        nexus_speak("error", f"❌ Send error: {e}")
+        logger.error("Send error: %s", e)
         return False
 
 def create_present_continuous_alert(present_signal):
@@ -74,9 +88,9 @@ def create_present_continuous_alert(present_signal):
         return f"❌ Error: {present_signal.get('error', 'Unknown error')}"
     
     # Extraer información del presente continuo
-    direction_info = present_signal.get('market_direction', {})
-    strategy_info = present_signal.get('selected_strategy', {})
-    entry_config = present_signal.get('entry_configuration', {})
+    direction_info = present_signal.get('market_direction') or {}
+    strategy_info = present_signal.get('selected_strategy') or {}
+    entry_config = present_signal.get('entry_configuration') or {}
     
     direction = direction_info.get('direction', 'neutral')
     confidence = direction_info.get('confidence', 0.5)
@@ -120,11 +134,20 @@ def create_present_continuous_alert(present_signal):
 🔥 PRESENTE CONTINUO - Trade inmediato
 ⚖️ ATM/Cerca del dinero - Sin especulación
 
-🕐 {datetime.now().strftime('%H:%M:%S')}
+🕐 {cached_strftime('%H:%M:%S')}
 🚀 Alpha Hunter V2 - Presente Continuo Engine"""
     
     return alert
 
+@lru_cache(maxsize=64)
+def _simple_trade_direction(strategy):
+    """(trade_type, direction) for a lowercased strategy name; bull/call wins over bear/put"""
+    if 'bull' in strategy or 'call' in strategy:
+        return "CALL 📈", "BULLISH"
+    if 'bear' in strategy or 'put' in strategy:
+        return "PUT 📉", "BEARISH"
+    return "NEUTRAL 🔄", "SIDEWAYS"
+
 def create_simple_alert(signal):
     """Crea alerta SIMPLE para amigos - Solo CALL/PUT, máximo 2 semanas"""
     if 'error' in signal:
@@ -132,48 +155,48 @@ def create_simple_alert(signal):
     
     # Determinar si es CALL o PUT según la estrategia
     strategy = signal.get('strategy_type', signal.get('strategy', 'unknown')).lower()
-    if 'bull' in strategy or 'call' in strategy:
-        trade_type = "CALL 📈"
-        direction = "BULLISH"
-    elif 'bear' in strategy or 'put' in strategy:
-        trade_type = "PUT 📉"
-        direction = "BEARISH"
-    else:
-        trade_type = "NEUTRAL 🔄"
-        direction = "SIDEWAYS"
+    trade_type, direction = _simple_trade_direction(strategy)
+    trade_label = trade_type.upper()
+    
+    # Nested sections resolved once
+    price = (signal.get('market_data') or {}).get('current_price', 0)
+    breakdown = signal.get('probability_breakdown') or {}
+    risk = (signal.get('position_sizing') or {}).get('risk_per_trade', 2.0)
+    expected_return = (signal.get('professional_metrics') or {}).get('expected_return', 8)
+    probability = signal.get('enhanced_probability', 50)
     
     # Formato SIMPLE sin confusión para amigos
     alert = f"""🚀 ALPHA HUNTER - OPORTUNIDAD DETECTADA
 
 📊 TICKER: {signal.get('symbol', 'UNKNOWN')}
-💰 PRECIO: ${signal.get('market_data', {}).get('current_price', 0):.2f}
+💰 PRECIO: ${price:.2f}
 🎯 DIRECCION: {direction}
-⚡ PROBABILIDAD: {signal.get('enhanced_probability', 50)}%
+⚡ PROBABILIDAD: {probability}%
 🔬 CONFIANZA DEL ECOSISTEMA: {signal.get('signal_quality', 0)}/100
 
 🔍 ANALISIS COMPONENTES:
 
-📈 Technical: {signal.get('probability_breakdown', {}).get('technical_analysis', 75)}% (confianza: {signal.get('signal_quality', 85)}%)
-💼 Fundamental: ALCISTA {signal.get('probability_breakdown', {}).get('monte_carlo', 65)}% (confianza: {signal.get('signal_quality', 85)}%)
-📰 Sentiment: ALCISTA {signal.get('probability_breakdown', {}).get('historical_backtest', 70)}% (confianza: {signal.get('signal_quality', 80)}%)
+📈 Technical: {breakdown.get('technical_analysis', 75)}% (confianza: {signal.get('signal_quality', 85)}%)
+💼 Fundamental: ALCISTA {breakdown.get('monte_carlo', 65)}% (confianza: {signal.get('signal_quality', 85)}%)
+📰 Sentiment: ALCISTA {breakdown.get('historical_backtest', 70)}% (confianza: {signal.get('signal_quality', 80)}%)
 
 🎯 RESUMEN:
-📈 Alcista: {signal.get('enhanced_probability', 50)}% | 📉 Bajista: {100 - signal.get('enhanced_probability', 50)}%
+📈 Alcista: {probability}% | 📉 Bajista: {100 - probability}%
 🔥 Señal: {direction}
 
 🚀 ESTRATEGIA RECOMENDADA:
-🎯 {trade_type.upper()}
-💰 Retorno esperado: {signal.get('professional_metrics', {}).get('expected_return', 8)}%
-⚖️ Riesgo: {signal.get('position_sizing', {}).get('risk_per_trade', 2.0):.1f}%
+🎯 {trade_label}
+💰 Retorno esperado: {expected_return}%
+⚖️ Riesgo: {risk:.1f}%
 
 📋 DETALLES OPERACIONALES:
-🎯 {trade_type.upper()} - Precio Objetivo: ${signal.get('market_data', {}).get('current_price', 0) * 1.05:.2f}
-💰 Take Profit: ${signal.get('market_data', {}).get('current_price', 0) * 1.12:.2f} | 🛑 Stop Loss: ${signal.get('market_data', {}).get('current_price', 0) * 0.95:.2f}
+🎯 {trade_label} - Precio Objetivo: ${price * 1.05:.2f}
+💰 Take Profit: ${price * 1.12:.2f} | 🛑 Stop Loss: ${price * 0.95:.2f}
 🧠 LÓGICA DE LA DECISIÓN:
-💡 {direction} con probabilidad {signal.get('enhanced_probability', 50):.1f}%. Mantener posición máximo 2 semanas. Riesgo controlado {signal.get('position_sizing', {}).get('risk_per_trade', 2.0):.1f}%.
+💡 {direction} con probabilidad {probability:.1f}%. Mantener posición máximo 2 semanas. Riesgo controlado {risk:.1f}%.
 
 🔥 ALPHA HUNTER - AI ANALYSIS
-🕐 {datetime.now().strftime('%H:%M:%S')}
+🕐 {cached_strftime('%H:%M:%S')}
 🚀 Sistema automatizado activo"""
     
     return alert
@@ -213,65 +236,108 @@ def test_professional_telegram():
         nexus_speak("error", f"❌ Signal generation failed: {signal['error']}")
         return False
 
-def send_multiple_alerts():
-    """Send multiple professional alerts"""
+def pack_into_chunks(messages, max_len=4000, sep="\n\n——\n\n"):
+    """Join consecutive messages into chunks under Telegram's length limit
+    
+    Yields (chunk_text, message_count) so callers can tell which messages
+    went out in each chunk. Order is preserved; a single message longer
+    than max_len is yielded on its own.
+    """
+    chunk, count, length = [], 0, 0
+    for message in messages:
+        extra = len(message) + (len(sep) if chunk else 0)
+        if chunk and length + extra > max_len:
+            yield sep.join(chunk), count
+            chunk, count, length = [], 0, 0
+            extra = len(message)
+        chunk.append(message)
+        count += 1
+        length += extra
+    if chunk:
+        yield sep.join(chunk), count
+
+async def _send_async(session, url, chat_id, message):
+    """Send clean message to Telegram without blocking the event loop
+    
+    Retries with backoff like the sync path; the backoff only delays this message.
+    """
+    payload = {
+        "chat_id": chat_id,
+        "text": clean_telegram_message(message)
+    }
+    return await safe_telegram_send_async(session, url, payload)
+
+async def send_multiple_alerts_async():
+    """Send multiple professional alerts packed into as few messages as possible"""
     nexus_speak("info", "🚀 Sending multiple Alpha Hunter V2 alerts")
     
+    if not _BOT_TOKEN or not _CHAT_ID:
+        nexus_speak("error", "❌ Telegram credentials not configured")
+        return 0
+    
     # Initialize system
     alpha_hunter = AlphaHunterV2Professional()
     
     # Symbols to analyze
     symbols = [("SPY", "bull_put"), ("QQQ", "iron_condor"), ("IWM", "bull_put")]
     
-    # Send header
+    loop = asyncio.get_running_loop()
+    
+    async def process_symbol(symbol, strategy):
+        """Return (is_alert, text) for one symbol"""
+        logger.info("Analyzing %s...", symbol)
+        try:
+            # generate_professional_signal is blocking; run it off the loop
+            signal = await loop.run_in_executor(
+                None, alpha_hunter.generate_professional_signal, symbol, strategy, 1000
+            )
+        except Exception as e:
+            logger.error("Error with %s: %s", symbol, e)
+            return False, f"❌ Critical error with {symbol}: {str(e)}"
+        
+        if 'error' in signal:
+            return False, f"❌ {symbol} analysis failed: {signal.get('error', 'Unknown')}"
+        return True, create_simple_alert(signal)
+    
+    results = await asyncio.gather(*(process_symbol(symbol, strategy) for symbol, strategy in symbols))
+    
     header = f"""🔥 ALPHA HUNTER V2 PROFESSIONAL ALERTS 🔥
-📅 {datetime.now().strftime("%Y-%m-%d %H:%M")}
+📅 {cached_strftime("%Y-%m-%d %H:%M")}
 
 ⚡ REAL PROBABILITIES SYSTEM ACTIVE
 📊 Monte Carlo | Historical | Technical | ML Enhanced
 🎯 Professional Trading Intelligence"""
     
-    send_clean_telegram(header)
-    
-    import time
-    time.sleep(3)
+    # Header and per-symbol texts share as few messages as fit
+    entries = [(False, header), *results]
     
     successful = 0
-    for symbol, strategy in symbols:
-        try:
-            nexus_speak("info", f"📊 Analyzing {symbol}...")
-            
-            signal = alpha_hunter.generate_professional_signal(symbol, strategy, 1000)
-            
-            if 'error' not in signal:
-                alert = create_simple_alert(signal)
-                if send_clean_telegram(alert):
-                    successful += 1
-                    nexus_speak("success", f"✅ {symbol} alert sent!")
-                time.sleep(4)  # Delay between messages
-            else:
-                error_msg = f"❌ {symbol} analysis failed: {signal.get('error', 'Unknown')}"
-                send_clean_telegram(error_msg)
-                
-        except Exception as e:
-            error_msg = f"❌ Critical error with {symbol}: {str(e)}"
-            send_clean_telegram(error_msg)
-            nexus_speak("error", f"❌ Error with {symbol}: {e}")
-    
-    # Send summary
-    summary = f"""📊 ALPHA HUNTER V2 SESSION COMPLETE
+    offset = 0
+    timeout = aiohttp.ClientTimeout(total=10)
+    async with aiohttp.ClientSession(timeout=timeout) as session:
+        # Chunks go out in order so the conversation reads top to bottom
+        for chunk, count in pack_into_chunks([text for _, text in entries]):
+            if await _send_async(session, _URL, _CHAT_ID, chunk):
+                successful += sum(is_alert for is_alert, _ in entries[offset:offset + count])
+            offset += count
+        
+        # Summary goes last, on its own, so it only counts alerts that went out
+        summary = f"""📊 ALPHA HUNTER V2 SESSION COMPLETE
 
 ✅ Alerts Sent: {successful}/{len(symbols)}
 🎯 System: 100% Operational  
 ⚡ Professional Intelligence Active
 
 Next analysis available immediately."""
-    
-    send_clean_telegram(summary)
+        await _send_async(session, _URL, _CHAT_ID, summary)
     
     nexus_speak("success", f"🚀 Session complete! {successful}/{len(symbols)} alerts sent")
     return successful
 
+def send_multiple_alerts():
+    """Send multiple professional alerts"""
+    return asyncio.run(send_multiple_alerts_async())
+
 if __name__ == "__main__":
     import argparse
     
@@ -281,6 +347,8 @@ if __name__ == "__main__":
     
     args = parser.parse_args()
     
+    logging.basicConfig(level=os.getenv("ALPHA_LOG", "WARNING"), format="%(message)s")
+    
     if args.test:
         result = test_professional_telegram()
         print(f"\nResult: {'✅ SUCCESS' if result else '❌ FAILED'}")
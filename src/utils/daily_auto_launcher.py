@@ -19,62 +19,170 @@ activate_nuclear_option()
 
 import time
 from datetime import datetime, timedelta
+from functools import lru_cache
 import subprocess
 import json
-from safe_send_utility import safe_subprocess_run, safe_subprocess_communicate, safe_send, get_safe_send_stats
+from safe_send_utility import safe_subprocess_run, safe_send, get_safe_send_stats
 # Import global subprocess patcher to protect ALL subprocess calls system-wide
 import global_subprocess_patcher
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Add parent directory to path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from scanner_daemon import request_scan
+
 try:
     from utils.nexus_utils import nexus_speak
 except ImportError:
     def nexus_speak(level, message):
         print(f"[{level.upper()}] {message}")
 
+STARTUP_MSG_TEMPLATE = """🚀 ALPHA HUNTER V2 FIXED - PRODUCTION READY
+📅 {timestamp}
+
+⚡ System Status: ONLINE
+🧠 Professional Analysis: ACTIVE  
+📊 Probability Engine: READY
+💰 Strategy Optimizer: LOADED
+🛠️ Unicode Fixes: APPLIED
+
+🔄 Scanning 25 premium opportunities...
+📱 Individual alerts incoming!
+
+Alpha Hunter V2 - Reliable Trading Intelligence"""
+
+_LAUNCHED_BANNER = """
+🚀 ALPHA HUNTER V2 MULTI-SCAN LAUNCHED
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+📅 Time: {time}
+🔄 Execution: #{count} today
+🎯 Status: Running fresh S&P 500 analysis
+📊 Coverage: Top 15 tickers from S&P 500
+💰 Budget: $500-1000 dynamic allocation
+📱 Alerts: Will be sent automatically to Telegram
+
+⚡ Alpha Hunter V2 runs every terminal session!
+🔄 Fresh opportunities analysis in progress.
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+"""
+
+_STATUS_BANNER = """
+📊 ALPHA HUNTER V2 STATUS CHECK
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+📅 Current: {time}
+📋 Status: {reason}
+
+ℹ️  Alpha Hunter V2 runs every terminal session 24/7
+⚡ Always ready for fresh market analysis
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+"""
+
+@lru_cache(maxsize=None)
+def _get_telegram():
+    """Importa telegram_sender_fixed una sola vez (queda en sys.modules y usa su .pyc)"""
+    import telegram_sender_fixed
+    return telegram_sender_fixed
+
+def _dumps_status(status_data):
+    """Serializa el estado a bytes JSON compactos (orjson si está instalado)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(status_data)
+    return json.dumps(status_data, separators=(',', ':')).encode('utf-8')
+
+def _loads_status(raw):
+    """Parsea los bytes de daily_status.json"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+def _detach_closed_output():
+    """Apunta stdout/stderr a /dev/null tras un EPIPE: los prints siguientes no cuestan nada"""
+    devnull = os.open(os.devnull, os.O_WRONLY)
+    for stream in (sys.stdout, sys.stderr):
+        try:
+            os.dup2(devnull, stream.fileno())
+        except (OSError, ValueError):
+            pass
+
+def _print_banner(text):
+    """Escribe un bloque del launcher en un solo write() tolerando una terminal cerrada"""
+    try:
+        sys.stdout.write(text)
+        sys.stdout.flush()
+    except BrokenPipeError:
+        _detach_closed_output()
+
 class DailyAutoLauncher:
     """Lanzador automático diario de Alpha Hunter V2"""
     
     def __init__(self):
         self.base_path = "/Volumes/DiskExFAT 1/system_data/nucleo_agi/alpha_hunter"
         self.status_file = f"{self.base_path}/daily_status.json"
+        
+        # telegram_sender_fixed lives in base_path; import it normally from there
+        if self.base_path not in sys.path:
+            sys.path.append(self.base_path)
+        
+        # Parsed status file, reparsed only when its mtime changes
+        self._status_cache = {}
+        self._status_mtime_ns = -1
+        
         self.last_run_date = self.get_last_run_date()
+        self.last_execution_count = 0
         
+    def _load_status(self):
+        """Lee daily_status.json solo si cambió desde la última lectura"""
+        try:
+            mtime_ns = os.stat(self.status_file).st_mtime_ns
+        except OSError:
+            return {}
+        
+        if mtime_ns != self._status_mtime_ns:
+            try:
+                with open(self.status_file, 'rb') as f:
+                    self._status_cache = _loads_status(f.read())
+            except (OSError, ValueError):
+                self._status_cache = {}
+            self._status_mtime_ns = mtime_ns
+        
+        return self._status_cache
+    
     def get_last_run_date(self):
         """Obtiene la fecha del último escaneo"""
-        try:
-            if os.path.exists(self.status_file):
-                with open(self.status_file, 'r') as f:
-                    status = json.load(f)
-                    return status.get('last_run_date', '')
-            return ''
-        except:
-            return ''
+        return self._load_status().get('last_run_date', '')
     
     def get_execution_count(self):
         """Obtiene el contador de ejecuciones del día"""
-        try:
-            if os.path.exists(self.status_file):
-                with open(self.status_file, 'r') as f:
-                    status = json.load(f)
-                    today = datetime.now().strftime('%Y-%m-%d')
-                    last_run_date = status.get('last_run_date', '')
-                    
-                    # Reset counter if new day
-                    if last_run_date != today:
-                        return 0
-                    return status.get('execution_count', 0)
-            return 0
-        except:
+        status = self._load_status()
+        today = datetime.now().strftime('%Y-%m-%d')
+        
+        # Reset counter if new day
+        if status.get('last_run_date', '') != today:
             return 0
+        return status.get('execution_count', 0)
     
     def update_status(self, status_data):
         """Actualiza el estado del sistema"""
         try:
-            with open(self.status_file, 'w') as f:
-                json.dump(status_data, f, indent=2)
+            # Write a temp file and swap it in so a crash never leaves a partial status
+            tmp_path = self.status_file + '.tmp'
+            with open(tmp_path, 'wb') as f:
+                f.write(_dumps_status(status_data))
+            os.replace(tmp_path, self.status_file)
+            
+            # What we just wrote is the current status
+            self._status_cache = status_data
+            self._status_mtime_ns = os.stat(self.status_file).st_mtime_ns
         except Exception as e:
             nexus_speak("error", f"❌ Error updating status: {e}")
     
@@ -88,32 +196,13 @@ class DailyAutoLauncher:
     def send_startup_message(self):
         """Envía mensaje de startup"""
         try:
-            # Import telegram sender
-            telegram_file = f"{self.base_path}/telegram_sender_fixed.py"
+            startup_msg = STARTUP_MSG_TEMPLATE.format(
+                timestamp=datetime.now().strftime("%Y-%m-%d %H:%M")
+            )
             
-            if os.path.exists(telegram_file):
-                import importlib.util
-                spec = importlib.util.spec_from_file_location("telegram_sender", telegram_file)
-                telegram_module = importlib.util.module_from_spec(spec)
-                spec.loader.exec_module(telegram_module)
-                
-                startup_msg = f"""🚀 ALPHA HUNTER V2 FIXED - PRODUCTION READY
-📅 {datetime.now().strftime("%Y-%m-%d %H:%M")}
-
-⚡ System Status: ONLINE
-🧠 Professional Analysis: ACTIVE  
-📊 Probability Engine: READY
-💰 Strategy Optimizer: LOADED
-🛠️ Unicode Fixes: APPLIED
-
-🔄 Scanning 25 premium opportunities...
-📱 Individual alerts incoming!
-
-Alpha Hunter V2 - Reliable Trading Intelligence"""
-                
-                telegram_module.send_clean_telegram(startup_msg)
-                nexus_speak("success", "✅ Startup message sent")
-                return True
+            _get_telegram().send_clean_telegram(startup_msg)
+            nexus_speak("success", "✅ Startup message sent")
+            return True
         except Exception as e:
             nexus_speak("error", f"❌ Startup message failed: {e}")
             return False
@@ -123,6 +212,10 @@ Alpha Hunter V2 - Reliable Trading Intelligence"""
         try:
             nexus_speak("info", "🚀 Launching daily S&P 500 scan...")
             
+            # Resolved once: both status branches and the banner report this run
+            new_count = self.get_execution_count() + 1
+            self.last_execution_count = new_count
+            
             # Send startup notification
             self.send_startup_message()
             
@@ -136,65 +229,67 @@ Alpha Hunter V2 - Reliable Trading Intelligence"""
                 "--tickers", "25"  # Balance speed vs opportunities
             ]
             
-            # REFACTORED: Launch with safe subprocess handling (BrokenPipeError tolerant)
+            # Scanner output goes straight to log files: the kernel does the
+            # buffering, nothing is copied through Python and no pipe can break
+            log_dir = f"{self.base_path}/logs"
+            os.makedirs(log_dir, exist_ok=True)
+            stderr_path = f"{log_dir}/scanner_stderr.log"
+            
             try:
-                # Use safe subprocess execution with 5-minute timeout protection  
                 nexus_speak("info", f"🚀 Launching scanner with 5-minute timeout protection")
                 
-                process = subprocess.Popen(
-                    cmd,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    text=True
-                )
+                with open(f"{log_dir}/scanner_stdout.log", 'ab') as stdout_log, \
+                        open(stderr_path, 'ab') as stderr_log:
+                    process = subprocess.Popen(
+                        cmd,
+                        stdout=stdout_log,
+                        stderr=stderr_log
+                    )
                 
-                # Set 5-minute timeout to prevent hanging
-                import signal
+                nexus_speak("info", f"📊 Scanner launched with PID: {process.pid}")
+                nexus_speak("info", f"🔄 Waiting for scan completion (logs in {log_dir})...")
                 
-                def timeout_handler(signum, frame):
+                try:
+                    returncode = process.wait(timeout=300)
+                except subprocess.TimeoutExpired:
                     nexus_speak("warning", "⏰ Scanner timeout - terminating process")
                     process.terminate()
-                    raise TimeoutError("Scanner exceeded 5-minute timeout")
-                
-                signal.signal(signal.SIGALRM, timeout_handler)
-                signal.alarm(300)  # 5 minutes
-                
-                nexus_speak("info", f"📊 Scanner launched with PID: {process.pid}")
-                
-                # FIXED: Use safe_subprocess_communicate for BrokenPipeError tolerance
-                nexus_speak("info", "🔄 Waiting for scan completion with BrokenPipeError protection...")
-                
-                result = safe_subprocess_communicate(
-                    process=process,
-                    timeout=300,
-                    context="daily_scanner"
-                )
-                
-                # Cancel timeout alarm
-                signal.alarm(0)
+                    try:
+                        process.wait(5)
+                    except subprocess.TimeoutExpired:
+                        process.kill()
+                        process.wait()
+                    
+                    # The scan did run: record it so the execution count advances
+                    status = {
+                        'last_run_date': datetime.now().strftime('%Y-%m-%d'),
+                        'last_run_time': datetime.now().isoformat(),
+                        'status': 'timeout',
+                        'pid': process.pid,
+                        'execution_count': new_count,
+                        'returncode': process.returncode
+                    }
+                    self.update_status(status)
+                    
+                    return True  # Non-blocking, like a failed scan
                 
-                if result['success']:
-                    if result.get('pipe_error', False):
-                        nexus_speak("warning", "⚠️ Daily scan completed despite BrokenPipeError (process finished)")
-                    elif result.get('timeout', False):
-                        nexus_speak("warning", "⚠️ Daily scan timeout - continuing in background")
-                    else:
-                        nexus_speak("success", "✅ Daily scan completed successfully via safe subprocess!")
+                if returncode == 0:
+                    nexus_speak("success", "✅ Daily scan completed successfully!")
                     
                     # Update status (ahora incluye contador de ejecuciones)  
                     status = {
                         'last_run_date': datetime.now().strftime('%Y-%m-%d'),
                         'last_run_time': datetime.now().isoformat(),
-                        'status': 'completed' if not result.get('timeout', False) else 'running',
+                        'status': 'completed',
                         'pid': process.pid,
-                        'execution_count': self.get_execution_count() + 1,
-                        'returncode': result['returncode']
+                        'execution_count': new_count,
+                        'returncode': returncode
                     }
                     self.update_status(status)
                     
                     return True
                 else:
-                    nexus_speak("error", f"❌ Scanner failed: {result['stderr']}")
+                    nexus_speak("error", f"❌ Scanner failed with exit code {returncode} (see {stderr_path})")
                     nexus_speak("warning", "⚠️ But Daily Scan system continues running (non-blocking failure)")
                     
                     # Even if subprocess failed, don't block the Daily Scan system
@@ -203,9 +298,9 @@ Alpha Hunter V2 - Reliable Trading Intelligence"""
                         'last_run_time': datetime.now().isoformat(),
                         'status': 'failed_non_blocking',
                         'pid': process.pid,
-                        'execution_count': self.get_execution_count() + 1,
-                        'returncode': result['returncode'],
-                        'error': result['stderr']
+                        'execution_count': new_count,
+                        'returncode': returncode,
+                        'error': f"see {stderr_path}"
                     }
                     self.update_status(status)
                     
@@ -225,45 +320,44 @@ Alpha Hunter V2 - Reliable Trading Intelligence"""
         
         if should_run:
             nexus_speak("info", f"🎯 Launching daily scan: {reason}")
-            success = self.launch_daily_scan()
+            
+            # Hand the scan to the resident daemon so the terminal returns at once;
+            # run it in-process only if the daemon can't be reached
+            reply = request_scan()
+            if reply and reply.split()[0] in ("STARTED", "BUSY"):
+                verb, count = reply.split()
+                if verb == "BUSY":
+                    nexus_speak("info", f"⏳ Scan #{count} still running in the daemon")
+                self.last_execution_count = int(count)
+                success = True
+            else:
+                nexus_speak("warning", f"⚠️ Scanner daemon unavailable ({reply}) - running scan here")
+                success = self.launch_daily_scan()
             
             if success:
-                execution_count = self.get_execution_count() + 1
-                print(f"""
-🚀 ALPHA HUNTER V2 MULTI-SCAN LAUNCHED
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-
-📅 Time: {datetime.now().strftime('%Y-%m-%d %H:%M')}
-🔄 Execution: #{execution_count} today
-🎯 Status: Running fresh S&P 500 analysis
-📊 Coverage: Top 15 tickers from S&P 500
-💰 Budget: $500-1000 dynamic allocation
-📱 Alerts: Will be sent automatically to Telegram
-
-⚡ Alpha Hunter V2 runs every terminal session!
-🔄 Fresh opportunities analysis in progress.
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-                """)
+                _print_banner(_LAUNCHED_BANNER.format(
+                    time=datetime.now().strftime('%Y-%m-%d %H:%M'),
+                    count=self.last_execution_count
+                ))
             else:
                 print("❌ Failed to launch scan")
         else:
             nexus_speak("info", f"⏭️ Skipping scan: {reason}")
-            print(f"""
-📊 ALPHA HUNTER V2 STATUS CHECK
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-
-📅 Current: {datetime.now().strftime('%Y-%m-%d %H:%M')}
-📋 Status: {reason}
-
-ℹ️  Alpha Hunter V2 runs every terminal session 24/7
-⚡ Always ready for fresh market analysis
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-            """)
+            _print_banner(_STATUS_BANNER.format(
+                time=datetime.now().strftime('%Y-%m-%d %H:%M'),
+                reason=reason
+            ))
 
 def main():
     """Función principal del auto launcher"""
     launcher = DailyAutoLauncher()
     launcher.check_and_launch()
+    
+    # Single flush at exit; a closed terminal must not end in a traceback
+    try:
+        sys.stdout.flush()
+    except BrokenPipeError:
+        _detach_closed_output()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -6,10 +6,44 @@ Created by Michael David Jaramillo
 Utility functions for logging and system communication.
 """
 
+import os
 import sys
+import time
 from datetime import datetime
 from typing import Optional
 
+# fmt -> (epoch second, formatted string) of the last cached_strftime call
+_strftime_cache = {}
+
+def cached_strftime(fmt: str = '%H:%M:%S') -> str:
+    """
+    Current local time formatted with fmt, reformatted at most once per second.
+    
+    Args:
+        fmt: strftime format string
+    """
+    second = int(time.time())
+    cached = _strftime_cache.get(fmt)
+    if cached is None or cached[0] != second:
+        cached = (second, datetime.fromtimestamp(second).strftime(fmt))
+        _strftime_cache[fmt] = cached
+    return cached[1]
+
+# Level indicators, built once
+_LEVEL_FORMATS = {
+    'info': "ℹ️  [INFO]",
+    'success': "✅ [SUCCESS]", 
+    'warning': "⚠️  [WARNING]",
+    'error': "❌ [ERROR]",
+    'debug': "🔍 [DEBUG]",
+    'system': "🤖 [SYSTEM]"
+}
+_STDERR_LEVELS = frozenset({'error', 'warning'})
+
+# Level gating; set NEXUS_LOG_LEVEL=debug to see debug output
+_LEVEL_RANK = {'debug': 10, 'info': 20, 'success': 20, 'warning': 30, 'error': 40, 'system': 20}
+_MIN_RANK = _LEVEL_RANK.get(os.environ.get('NEXUS_LOG_LEVEL', 'info').lower(), 20)
+
 def nexus_speak(level: str, message: str, prefix: Optional[str] = None) -> None:
     """
     Professional logging function with level-based formatting.
@@ -19,19 +53,14 @@ def nexus_speak(level: str, message: str, prefix: Optional[str] = None) -> None:
         message: Message to log
         prefix: Optional prefix for the message
     """
-    timestamp = datetime.now().strftime('%H:%M:%S')
+    lvl = level.lower()
+    # Custom levels rank as info so they keep printing by default
+    if _LEVEL_RANK.get(lvl, 20) < _MIN_RANK:
+        return
+    timestamp = cached_strftime('%H:%M:%S')
     
     # Level formatting
-    level_formats = {
-        'info': f"ℹ️  [INFO]",
-        'success': f"✅ [SUCCESS]", 
-        'warning': f"⚠️  [WARNING]",
-        'error': f"❌ [ERROR]",
-        'debug': f"🔍 [DEBUG]",
-        'system': f"🤖 [SYSTEM]"
-    }
-    
-    level_indicator = level_formats.get(level.lower(), f"📝 [{level.upper()}]")
+    level_indicator = _LEVEL_FORMATS.get(lvl) or f"📝 [{level.upper()}]"
     
     # Build message
     if prefix:
@@ -40,11 +69,11 @@ def nexus_speak(level: str, message: str, prefix: Optional[str] = None) -> None:
         formatted_message = f"{level_indicator} {message}"
     
     # Add timestamp if not error level
-    if level.lower() != 'error':
+    if lvl != 'error':
         formatted_message = f"[{timestamp}] {formatted_message}"
     
     # Print to appropriate stream
-    if level.lower() in ['error', 'warning']:
+    if lvl in _STDERR_LEVELS:
         print(formatted_message, file=sys.stderr)
     else:
         print(formatted_message)
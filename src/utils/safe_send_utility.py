@@ -6,23 +6,58 @@ Created by Michael David Jaramillo
 Robust Telegram sending with error tolerance and retry logic.
 """
 
+import asyncio
+import json
+import threading
 import time
+from collections import Counter
 import requests
+from requests.adapters import HTTPAdapter
 from typing import Dict, Optional, Any
 import logging
 
-# Statistics tracking
-_send_stats = {
-    'total_attempts': 0,
-    'successful_sends': 0,
-    'failed_sends': 0,
-    'brokenpipe_errors': 0,
-    'timeout_errors': 0,
-    'other_errors': 0
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+_SEND_HEADERS = {
+    'Content-Type': 'application/json',
+    'User-Agent': 'Alpha-Hunter-Signals/1.0'
 }
 
+# Pooled keep-alive session shared by every send; retries stay in our loop
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=0))
+_SESSION.headers.update(_SEND_HEADERS)
+
+# Statistics tracking: each send tallies locally and flushes once when it ends
+_send_stats = Counter()
+_stats_lock = threading.Lock()
+
+def _flush_stats(tally: Counter) -> None:
+    """Merge one send's tally into the module statistics."""
+    with _stats_lock:
+        _send_stats.update(tally)
+
+def dumps_json(payload: Dict[str, Any]) -> bytes:
+    """
+    Serialize a request payload to UTF-8 JSON bytes (orjson when installed).
+    
+    Args:
+        payload: JSON-serializable payload
+        
+    Returns:
+        bytes: Encoded request body
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode('utf-8')
+
 def safe_telegram_send(url: str, payload: Dict[str, Any], 
-                      timeout: int = 10, max_retries: int = 3) -> bool:
+                      timeout: int = 10, max_retries: int = 3,
+                      session: Optional[requests.Session] = None) -> bool:
     """
     Send Telegram message with robust error handling and retries.
     
@@ -31,50 +66,109 @@ def safe_telegram_send(url: str, payload: Dict[str, Any],
         payload: Message payload
         timeout: Request timeout in seconds
         max_retries: Maximum retry attempts
+        session: Optional requests.Session (defaults to the shared pool)
         
     Returns:
         bool: True if message sent successfully
     """
-    global _send_stats
+    poster = session or _SESSION
+    headers = None if poster is _SESSION else _SEND_HEADERS  # _SESSION already carries them
+    body = dumps_json(payload)  # Encoded once, reused across retries
     
-    for attempt in range(max_retries):
-        _send_stats['total_attempts'] += 1
+    tally = Counter()
+    try:
+        for attempt in range(max_retries):
+            tally['total_attempts'] += 1
         
-        try:
-            response = requests.post(
-                url, 
-                json=payload, 
-                timeout=timeout,
-                headers={
-                    'Content-Type': 'application/json',
-                    'User-Agent': 'Alpha-Hunter-Signals/1.0'
-                }
-            )
+            try:
+                response = poster.post(
+                    url, 
+                    data=body, 
+                    timeout=timeout,
+                    headers=headers
+                )
             
-            if response.status_code == 200:
-                _send_stats['successful_sends'] += 1
-                return True
-            else:
-                logging.warning(f"Telegram API returned status {response.status_code}: {response.text}")
+                if response.status_code == 200:
+                    tally['successful_sends'] += 1
+                    return True
+                else:
+                    logging.warning(f"Telegram API returned status {response.status_code}: {response.text}")
                 
-        except requests.exceptions.Timeout:
-            _send_stats['timeout_errors'] += 1
-            logging.warning(f"Timeout on attempt {attempt + 1}/{max_retries}")
+            except requests.exceptions.Timeout:
+                tally['timeout_errors'] += 1
+                logging.warning(f"Timeout on attempt {attempt + 1}/{max_retries}")
             
-        except BrokenPipeError:
-            _send_stats['brokenpipe_errors'] += 1
-            logging.warning(f"BrokenPipeError on attempt {attempt + 1}/{max_retries}")
+            except BrokenPipeError:
+                tally['brokenpipe_errors'] += 1
+                logging.warning(f"BrokenPipeError on attempt {attempt + 1}/{max_retries}")
             
-        except Exception as e:
-            _send_stats['other_errors'] += 1
-            logging.warning(f"Error on attempt {attempt + 1}/{max_retries}: {e}")
+            except Exception as e:
+                tally['other_errors'] += 1
+                logging.warning(f"Error on attempt {attempt + 1}/{max_retries}: {e}")
         
-        # Wait before retry (exponential backoff)
-        if attempt < max_retries - 1:
-            time.sleep(2 ** attempt)
+            # Wait before retry (exponential backoff)
+            if attempt < max_retries - 1:
+                time.sleep(2 ** attempt)
     
-    _send_stats['failed_sends'] += 1
-    return False
+        tally['failed_sends'] += 1
+        return False
+    finally:
+        _flush_stats(tally)
+
+async def safe_telegram_send_async(session: 'aiohttp.ClientSession', url: str,
+                                   payload: Dict[str, Any], timeout: int = 10,
+                                   max_retries: int = 3) -> bool:
+    """
+    Async counterpart of safe_telegram_send; backoff only delays this message.
+    
+    Args:
+        session: Open aiohttp.ClientSession
+        url: Telegram API URL
+        payload: Message payload
+        timeout: Request timeout in seconds
+        max_retries: Maximum retry attempts
+        
+    Returns:
+        bool: True if message sent successfully
+    """
+    import aiohttp  # Only needed for async sends; keeps the sync importers light
+    
+    body = dumps_json(payload)
+    request_timeout = aiohttp.ClientTimeout(total=timeout)
+    
+    tally = Counter()
+    try:
+        for attempt in range(max_retries):
+            tally['total_attempts'] += 1
+        
+            try:
+                async with session.post(url, data=body, headers=_SEND_HEADERS,
+                                        timeout=request_timeout) as response:
+                    if response.status == 200:
+                        tally['successful_sends'] += 1
+                        return True
+                    logging.warning(f"Telegram API returned status {response.status}: {await response.text()}")
+                
+            except asyncio.TimeoutError:
+                tally['timeout_errors'] += 1
+                logging.warning(f"Timeout on attempt {attempt + 1}/{max_retries}")
+            
+            except BrokenPipeError:
+                tally['brokenpipe_errors'] += 1
+                logging.warning(f"BrokenPipeError on attempt {attempt + 1}/{max_retries}")
+            
+            except Exception as e:
+                tally['other_errors'] += 1
+                logging.warning(f"Error on attempt {attempt + 1}/{max_retries}: {e}")
+        
+            # Wait before retry (exponential backoff) without blocking other sends
+            if attempt < max_retries - 1:
+                await asyncio.sleep(2 ** attempt)
+    
+        tally['failed_sends'] += 1
+        return False
+    finally:
+        _flush_stats(tally)
 
 def safe_send(url: str, payload: Dict[str, Any], timeout: int = 10) -> bool:
     """
@@ -97,8 +191,6 @@ def get_safe_send_stats() -> Dict[str, Any]:
     Returns:
         Dict with send statistics
     """
-    global _send_stats
-    
     total = _send_stats['total_attempts']
     if total > 0:
         success_rate = (_send_stats['successful_sends'] / total) * 100
@@ -119,15 +211,8 @@ def get_safe_send_stats() -> Dict[str, Any]:
 
 def reset_safe_send_stats() -> None:
     """Reset send statistics."""
-    global _send_stats
-    _send_stats = {
-        'total_attempts': 0,
-        'successful_sends': 0,
-        'failed_sends': 0,
-        'brokenpipe_errors': 0,
-        'timeout_errors': 0,
-        'other_errors': 0
-    }
+    with _stats_lock:
+        _send_stats.clear()
 
 # For testing
 if __name__ == "__main__":
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+ALPHA HUNTER V2 - SCANNER DAEMON
+Proceso residente que ejecuta los escaneos; el auto launcher solo le envía SCAN
+y la terminal vuelve de inmediato en vez de esperar hasta 5 minutos.
+
+Protocolo (una línea por conexión sobre ~/.alpha_hunter/scanner.sock):
+    SCAN   -> "STARTED <n>" | "BUSY <n>"   (n = ejecución del día)
+    STATUS -> "<estado> <n>"               (starting | available | processing)
+"""
+
+import fcntl
+import logging
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+
+SOCKET_DIR = os.path.expanduser("~/.alpha_hunter")
+SOCKET_PATH = os.path.join(SOCKET_DIR, "scanner.sock")
+LOCK_PATH = os.path.join(SOCKET_DIR, "scanner.lock")
+
+# Tiempo máximo para que un cliente mande su línea; el daemon atiende de a uno
+CLIENT_TIMEOUT = 5.0
+
+STATE_STARTING = "starting"
+STATE_AVAILABLE = "available"
+STATE_PROCESSING = "processing"
+
+logger = logging.getLogger("alpha_hunter.scanner")
+
+class ScannerDaemon:
+    """Atiende comandos por el socket y corre como máximo un escaneo a la vez"""
+
+    def __init__(self, socket_path=SOCKET_PATH):
+        self.socket_path = socket_path
+        self.state = STATE_STARTING
+        self.execution_count = 0
+        self._lock = threading.Lock()
+        self._launcher = None
+
+    def _run_scan(self):
+        """Hilo de trabajo: un escaneo completo y vuelta a 'available'"""
+        try:
+            self._launcher.launch_daily_scan()
+        except Exception:
+            logger.exception("Scan failed")
+        finally:
+            with self._lock:
+                self.state = STATE_AVAILABLE
+
+    def handle_command(self, command):
+        """Procesa un comando y devuelve la línea de respuesta"""
+        with self._lock:
+            if command == "SCAN":
+                if self.state == STATE_PROCESSING:
+                    return f"BUSY {self.execution_count}"
+                self.execution_count = self._launcher.get_execution_count() + 1
+                self.state = STATE_PROCESSING
+                threading.Thread(target=self._run_scan, daemon=True).start()
+                return f"STARTED {self.execution_count}"
+            if command == "STATUS":
+                return f"{self.state} {self.execution_count}"
+        return "ERROR unknown command"
+
+    def serve_forever(self):
+        """Registra el socket y atiende conexiones hasta que maten el proceso"""
+        os.makedirs(SOCKET_DIR, exist_ok=True)
+
+        # Un solo daemon: el flock se suelta solo cuando el proceso muere, así que
+        # si dos terminales arrancan daemons a la vez el segundo sale sin tocar el socket
+        lock_fd = os.open(LOCK_PATH, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(lock_fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            os.close(lock_fd)
+            return
+        os.ftruncate(lock_fd, 0)
+        os.write(lock_fd, f"{os.getpid()}\n".encode())
+
+        # Imported here: daily_auto_launcher imports this module for its client side
+        from daily_auto_launcher import DailyAutoLauncher
+
+        # With the lock held, any socket left on disk belongs to a dead daemon
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        server.bind(self.socket_path)
+        server.listen(8)
+        try:
+            self._launcher = DailyAutoLauncher()
+            self.state = STATE_AVAILABLE
+            while True:
+                conn, _ = server.accept()
+                with conn:
+                    # A client that connects and never writes must not stall the daemon
+                    conn.settimeout(CLIENT_TIMEOUT)
+                    try:
+                        command = conn.makefile('r').readline().strip().upper()
+                    except OSError:
+                        continue  # Client timed out or went away; keep serving
+                    except ValueError:
+                        command = None  # Not UTF-8
+                    try:
+                        reply = "ERROR malformed command" if command is None else self.handle_command(command)
+                    except Exception as e:
+                        # A failing command must not take the daemon down with it
+                        logger.exception("Command %s failed", command)
+                        reply = f"ERROR {type(e).__name__}"
+                    try:
+                        conn.sendall((reply + "\n").encode())
+                    except OSError:
+                        pass
+        finally:
+            server.close()
+            try:
+                os.unlink(self.socket_path)
+            except OSError:
+                pass
+            os.close(lock_fd)
+
+def send_command(command, timeout=5.0):
+    """Envía un comando al daemon y devuelve su respuesta (OSError si no está)"""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.settimeout(timeout)
+        client.connect(SOCKET_PATH)
+        client.sendall((command + "\n").encode())
+        return client.makefile('r').readline().strip()
+
+def spawn_daemon():
+    """Arranca el daemon desacoplado de la terminal"""
+    subprocess.Popen(
+        [sys.executable, os.path.abspath(__file__)],
+        start_new_session=True,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL
+    )
+
+def request_scan(startup_timeout=30.0):
+    """
+    Pide un escaneo al daemon, arrancándolo si hace falta.
+
+    Espera al socket con sondeo adaptativo (50ms, doblando hasta 2s).
+    Devuelve la respuesta del daemon o None si no llegó a estar disponible.
+    """
+    try:
+        return send_command("SCAN")
+    except OSError:
+        spawn_daemon()
+
+    deadline = time.monotonic() + startup_timeout
+    delay = 0.05
+    while time.monotonic() < deadline:
+        time.sleep(delay)
+        delay = min(delay * 2, 2.0)
+        try:
+            # Missing/refused until serve_forever has bound the socket
+            return send_command("SCAN")
+        except OSError:
+            continue
+    return None
+
+if __name__ == "__main__":
+    ScannerDaemon().serve_forever()
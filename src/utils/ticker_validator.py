@@ -7,36 +7,41 @@ Validates S&P 500 ticker symbols and filters valid trading symbols.
 """
 
 import re
-from typing import List, Set, Optional
+from functools import lru_cache
+from typing import Iterable, Iterator, List, Set, Optional
+
+# Core S&P 500 tickers (most common and liquid)
+_SP500_CORE = frozenset({
+    'AAPL', 'MSFT', 'GOOGL', 'AMZN', 'NVDA', 'META', 'TSLA', 'AVGO', 'WMT', 'LLY',
+    'JPM', 'UNH', 'XOM', 'V', 'PG', 'JNJ', 'MA', 'HD', 'NFLX', 'ABBV',
+    'PEP', 'KO', 'COST', 'MRK', 'ADBE', 'WFC', 'CVX', 'LIN', 'TMO', 'MCD',
+    'ABT', 'CSCO', 'ACN', 'DHR', 'TXN', 'PM', 'VZ', 'INTC', 'CRM', 'AMD',
+    'BMY', 'QCOM', 'CMCSA', 'NEE', 'RTX', 'AMGN', 'HON', 'COP', 'T', 'UNP',
+    'LOW', 'BA', 'SPGI', 'LMT', 'PFE', 'ISRG', 'BLK', 'CAT', 'DE', 'AXP',
+    'BKNG', 'TJX', 'GE', 'MDT', 'ADP', 'GILD', 'TMUS', 'SYK', 'CB', 'MDLZ',
+    'CI', 'SO', 'SCHW', 'MO', 'ZTS', 'CVS', 'REGN', 'PLD', 'DUK', 'EOG',
+    'ITW', 'BDX', 'MMC', 'TGT', 'USB', 'APH', 'SLB', 'BSX', 'FI', 'EMR',
+    'CL', 'NSC', 'AON', 'GD', 'ICE', 'FCX', 'PGR', 'DG', 'CME', 'HUM'
+})
+
+# Extended S&P 500 (additional valid tickers)
+_SP500_EXTENDED = frozenset({
+    'SPY', 'QQQ', 'IWM', 'DIA', 'VTI', 'VOO', 'ARKK', 'SQQQ', 'TQQQ', 'SOXL',
+    'XLF', 'XLE', 'XLI', 'XLK', 'XLV', 'XLP', 'XLY', 'XLU', 'XLB', 'XLRE',
+    'GS', 'MS', 'BAC', 'C', 'WFC', 'COF', 'AIG', 'TRV', 'ALL', 'MET',
+    'PRU', 'AFL', 'AMP', 'BRK.B', 'BRK.A', 'HCA', 'UHS', 'DVA', 'ANTM', 'CNC'
+})
+
+# All valid tickers combined; static data shared by every validator
+_ALL_VALID = _SP500_CORE | _SP500_EXTENDED
 
 class TickerValidator:
     """Validates and filters S&P 500 ticker symbols."""
     
     def __init__(self):
-        # Core S&P 500 tickers (most common and liquid)
-        self.sp500_core_tickers = {
-            'AAPL', 'MSFT', 'GOOGL', 'AMZN', 'NVDA', 'META', 'TSLA', 'AVGO', 'WMT', 'LLY',
-            'JPM', 'UNH', 'XOM', 'V', 'PG', 'JNJ', 'MA', 'HD', 'NFLX', 'ABBV',
-            'PEP', 'KO', 'COST', 'MRK', 'ADBE', 'WFC', 'CVX', 'LIN', 'TMO', 'MCD',
-            'ABT', 'CSCO', 'ACN', 'DHR', 'TXN', 'PM', 'VZ', 'INTC', 'CRM', 'AMD',
-            'BMY', 'QCOM', 'CMCSA', 'NEE', 'RTX', 'AMGN', 'HON', 'COP', 'T', 'UNP',
-            'LOW', 'BA', 'SPGI', 'LMT', 'PFE', 'ISRG', 'BLK', 'CAT', 'DE', 'AXP',
-            'BKNG', 'TJX', 'GE', 'MDT', 'ADP', 'GILD', 'TMUS', 'SYK', 'CB', 'MDLZ',
-            'CI', 'SO', 'SCHW', 'MO', 'ZTS', 'CVS', 'REGN', 'PLD', 'DUK', 'EOG',
-            'ITW', 'BDX', 'MMC', 'TGT', 'USB', 'APH', 'SLB', 'BSX', 'FI', 'EMR',
-            'CL', 'NSC', 'AON', 'GD', 'ICE', 'FCX', 'PGR', 'DG', 'CME', 'HUM'
-        }
-        
-        # Extended S&P 500 (additional valid tickers)
-        self.sp500_extended = {
-            'SPY', 'QQQ', 'IWM', 'DIA', 'VTI', 'VOO', 'ARKK', 'SQQQ', 'TQQQ', 'SOXL',
-            'XLF', 'XLE', 'XLI', 'XLK', 'XLV', 'XLP', 'XLY', 'XLU', 'XLB', 'XLRE',
-            'GS', 'MS', 'BAC', 'C', 'WFC', 'COF', 'AIG', 'TRV', 'ALL', 'MET',
-            'PRU', 'AFL', 'AMP', 'BRK.B', 'BRK.A', 'HCA', 'UHS', 'DVA', 'ANTM', 'CNC'
-        }
-        
-        # All valid tickers combined
-        self.all_valid_tickers = self.sp500_core_tickers | self.sp500_extended
+        self.sp500_core_tickers = _SP500_CORE
+        self.sp500_extended = _SP500_EXTENDED
+        self.all_valid_tickers = _ALL_VALID
         
         # Invalid patterns to exclude
         self.invalid_patterns = [
@@ -45,6 +50,13 @@ class TickerValidator:
             r'.*-',           # Contains dashes
             r'^[0-9]',        # Starts with number
         ]
+        
+        # Compiled once; matched on every ticker
+        self._invalid_res = [re.compile(pattern) for pattern in self.invalid_patterns]
+        self._invalid_combined = re.compile('|'.join(f'(?:{p})' for p in self.invalid_patterns))
+        
+        # Daily scans resubmit the same symbols; memoize per normalized ticker
+        self._check_normalized = lru_cache(maxsize=4096)(self._validate_normalized)
     
     def is_valid_ticker(self, ticker: str) -> bool:
         """
@@ -61,20 +73,20 @@ class TickerValidator:
         
         ticker = ticker.upper().strip()
         
-        # Check if in known valid set
+        # Known tickers (the common case) never reach the cache or a regex
         if ticker in self.all_valid_tickers:
             return True
         
-        # Check against invalid patterns
-        for pattern in self.invalid_patterns:
-            if re.match(pattern, ticker):
-                return False
-        
-        # Basic validation: 1-5 characters, all letters
-        if not re.match(r'^[A-Z]{1,5}$', ticker):
+        return self._check_normalized(ticker)
+    
+    def _validate_normalized(self, ticker: str) -> bool:
+        """Uncached validation of an upper-cased, stripped, unknown ticker."""
+        # Basic validation: 1-5 characters, all ASCII letters
+        if not (ticker.isascii() and ticker.isalpha() and len(ticker) <= 5):
             return False
         
-        return True
+        # Check against invalid patterns
+        return not self._invalid_combined.match(ticker)
     
     def filter_valid_tickers(self, tickers: List[str]) -> List[str]:
         """
@@ -86,21 +98,26 @@ class TickerValidator:
         Returns:
             List of valid ticker symbols
         """
-        valid_tickers = []
+        # dict.fromkeys dedupes in one pass and keeps first-seen order
+        return list(dict.fromkeys(t.upper().strip() for t in tickers if self.is_valid_ticker(t)))
+    
+    def iter_valid_tickers(self, tickers: Iterable[str]) -> Iterator[str]:
+        """
+        Lazily yield valid tickers, normalized and without duplicates.
         
+        Args:
+            tickers: Iterable of ticker symbols
+            
+        Yields:
+            Valid ticker symbols in first-seen order
+        """
+        seen = set()
         for ticker in tickers:
             if self.is_valid_ticker(ticker):
-                valid_tickers.append(ticker.upper().strip())
-        
-        # Remove duplicates while preserving order
-        seen = set()
-        unique_valid = []
-        for ticker in valid_tickers:
-            if ticker not in seen:
-                seen.add(ticker)
-                unique_valid.append(ticker)
-        
-        return unique_valid
+                ticker = ticker.upper().strip()
+                if ticker not in seen:
+                    seen.add(ticker)
+                    yield ticker
     
     def get_high_quality_tickers(self, limit: Optional[int] = None) -> List[str]:
         """
@@ -160,34 +177,36 @@ class TickerValidator:
             result['reasons'].append('Known valid S&P 500 ticker')
         
         # Pattern checks
-        for pattern in self.invalid_patterns:
-            if re.match(pattern, ticker):
-                result['reasons'].append(f'Matches invalid pattern: {pattern}')
+        matched_invalid = False
+        for pattern in self._invalid_res:
+            if pattern.match(ticker):
+                matched_invalid = True
+                result['reasons'].append(f'Matches invalid pattern: {pattern.pattern}')
         
         # If no major issues found and basic format is correct
         if (len(ticker) <= 5 and len(ticker) >= 1 and 
-            ticker.isalpha() and not any(re.match(p, ticker) for p in self.invalid_patterns)):
+            ticker.isalpha() and not matched_invalid):
             if not result['valid']:  # Not in known list but format is OK
                 result['valid'] = True
                 result['reasons'].append('Valid format, unknown ticker')
         
         return result
 
+# Shared validator used by the convenience functions
+_DEFAULT_VALIDATOR = TickerValidator()
+
 # Convenience functions for backward compatibility
 def is_valid_ticker(ticker: str) -> bool:
     """Check if ticker is valid for trading."""
-    validator = TickerValidator()
-    return validator.is_valid_ticker(ticker)
+    return _DEFAULT_VALIDATOR.is_valid_ticker(ticker)
 
 def filter_valid_tickers(tickers: List[str]) -> List[str]:
     """Filter list to only valid tickers."""
-    validator = TickerValidator()
-    return validator.filter_valid_tickers(tickers)
+    return _DEFAULT_VALIDATOR.filter_valid_tickers(tickers)
 
 def get_high_quality_tickers(limit: Optional[int] = None) -> List[str]:
     """Get high-quality S&P 500 tickers."""
-    validator = TickerValidator()
-    return validator.get_high_quality_tickers(limit)
+    return _DEFAULT_VALIDATOR.get_high_quality_tickers(limit)
 
 # For testing
 if __name__ == "__main__":
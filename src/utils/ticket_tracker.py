@@ -5,83 +5,337 @@ Mantiene historial de tickets enviados y asegura solo oportunidades nuevas
 """
 
 import json
+import mmap
 import os
-from datetime import datetime, timedelta
+import weakref
+from datetime import date, datetime, timedelta
+from functools import lru_cache
 import hashlib
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+def _dumps(record):
+    """Serializa un registro a bytes JSON compactos (orjson si está instalado)."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(record, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(record).encode('utf-8')
+
+def _loads(line):
+    """Parsea una línea del log (bytes)."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(line)
+    return json.loads(line)
+
+def _parse_records(lines):
+    """
+    Parsea las líneas del log una a una. Se saltan las que no decodifican (p.ej. la
+    última a medias tras un corte) o no traen timestamp, en vez de perder el día entero.
+    """
+    records = []
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            record = _loads(line)
+        except ValueError:
+            continue
+        if isinstance(record, dict) and isinstance(record.get('timestamp'), str):
+            records.append(record)
+    return records
+
+def _record_day(record):
+    """Fecha (date) del registro, o None si su timestamp no es válido."""
+    try:
+        return date.fromisoformat(record.get('timestamp', '')[:10])
+    except ValueError:
+        return None
+
+@lru_cache(maxsize=4096, typed=True)
+def _ticket_hash(symbol, option_type, strike, expiry_date):
+    """Hash de ticket memoizado: los escaneos repiten los mismos pocos símbolos."""
+    ticket_string = f"{symbol}_{option_type}_{strike}_{expiry_date}"
+    # Huella de dedup, no criptográfica: 4 bytes de blake2b = 8 hex como antes
+    return hashlib.blake2b(ticket_string.encode(), digest_size=4).hexdigest()
+
+# Por encima de este tamaño el log se compacta al cargar
+COMPACT_THRESHOLD_BYTES = 1024 * 1024
+# Logs más grandes que esto se leen vía mmap (sin copia al buffer de lectura)
+MMAP_THRESHOLD_BYTES = 64 * 1024
+
+class TicketStore:
+    """
+    Tickets del día guardados por columnas (SoA) en vez de un dict por ticket.
+    Se itera e indexa como la antigua lista de dicts; los dicts se arman bajo demanda.
+    """
+    
+    FIELDS = ('hash', 'symbol', 'option_type', 'strike', 'expiry_date', 'sent_time', 'timestamp')
+    
+    def __init__(self, records=()):
+        self.hashes = []
+        self.symbols = []
+        self.option_types = []
+        self.strikes = []
+        self.expiry_dates = []
+        self.sent_times = []
+        self.timestamps = []
+        self.extras = []  # additional_data de cada ticket (None si no tiene)
+        self._row_by_hash = {}  # Índice primario: hash -> fila
+        self._columns = (self.hashes, self.symbols, self.option_types, self.strikes,
+                         self.expiry_dates, self.sent_times, self.timestamps)
+        
+        for record in records:
+            self.append(record)
+    
+    def append(self, record):
+        """Añade un registro (dict) repartiéndolo en las columnas."""
+        self._row_by_hash[record.get('hash')] = len(self.hashes)
+        for column, field in zip(self._columns, self.FIELDS):
+            column.append(record.get(field))
+        extra = {k: v for k, v in record.items() if k not in self.FIELDS}
+        self.extras.append(extra or None)
+    
+    def sent_time_of(self, ticket_hash):
+        """Hora de envío del ticket con ese hash, o None si no se envió hoy."""
+        row = self._row_by_hash.get(ticket_hash)
+        if row is None:
+            return None
+        return self.sent_times[row] or 'unknown'
+    
+    def __contains__(self, ticket_hash):
+        return ticket_hash in self._row_by_hash
+    
+    def _as_dict(self, i):
+        """Reconstruye el registro i como dict."""
+        record = {field: column[i] for column, field in zip(self._columns, self.FIELDS)}
+        if self.extras[i]:
+            record.update(self.extras[i])
+        return record
+    
+    def __len__(self):
+        return len(self.hashes)
+    
+    def __getitem__(self, i):
+        return self._as_dict(i)
+    
+    def __iter__(self):
+        for i in range(len(self.hashes)):
+            yield self._as_dict(i)
+
+class _AppendLog:
+    """
+    Handle de append persistente del log más las marcas diferidas pendientes.
+    No referencia al tracker, así su finalizador puede vaciarlo y cerrarlo
+    sin mantener vivo al TicketTracker.
+    """
+    
+    def __init__(self, path):
+        self.path = path
+        self.fh = None
+        self.pending = []
+    
+    def open(self):
+        """(Re)abre el handle de append sobre el archivo actual del log."""
+        self.close_handle()
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            self.fh = open(self.path, 'ab', buffering=1024 * 1024)
+            
+            # Una línea a medias de un corte previo no debe pegarse al próximo registro
+            if self.fh.tell() > 0:
+                with open(self.path, 'rb') as f:
+                    f.seek(-1, os.SEEK_END)
+                    if f.read(1) != b'\n':
+                        self.fh.write(b'\n')
+                        self.fh.flush()
+        except OSError as e:
+            print(f"⚠️ Error abriendo log de tickets: {e}")
+            self.fh = None
+    
+    def write(self, records):
+        """Añade tickets al log en una sola escritura (no relee ni reescribe el historial)."""
+        try:
+            payload = b''.join(_dumps(record) + b'\n' for record in records)
+            if self.fh is not None:
+                self.fh.write(payload)
+                self.fh.flush()  # Visible para otros procesos sin esperar al cierre
+            else:
+                with open(self.path, 'ab') as f:
+                    f.write(payload)
+        except Exception as e:
+            print(f"⚠️ Error guardando tickets: {e}")
+    
+    def flush(self):
+        """Escribe de una vez las marcas pendientes."""
+        if self.pending:
+            self.write(self.pending)
+            self.pending.clear()
+    
+    def close_handle(self):
+        if self.fh is not None:
+            self.fh.close()
+            self.fh = None
+    
+    def close(self):
+        """Persiste las marcas pendientes y cierra el handle."""
+        self.flush()
+        self.close_handle()
+
 class TicketTracker:
-    def __init__(self):
-        self.tracker_file = "/Volumes/DiskExFAT 1/system_data/nucleo_agi/alpha_hunter/sent_tickets.json"
+    def __init__(self, deferred=False, verbose=True):
+        # Log JSONL append-only: una línea por ticket enviado
+        self.tracker_file = "/Volumes/DiskExFAT 1/system_data/nucleo_agi/alpha_hunter/sent_tickets.jsonl"
+        
+        # Modo diferido: las marcas se acumulan en memoria hasta flush()
+        self.deferred = deferred
+        self._dirty = False
+        
+        # verbose=False silencia los reportes de las compuertas (producción)
+        self.verbose = verbose
+        
+        self._today_date = None
+        self._today_str = ''
+        self._log = _AppendLog(self.tracker_file)
         self.daily_tickets = self.load_daily_tickets()
+        self._rebuild_indexes()
         
+        # Handle de append persistente: marcar no abre ni cierra el archivo
+        # (la lectura usa su propio open/close en _read_records)
+        # Se vacía y cierra al recolectar el tracker o al salir, sin atexit por instancia
+        self._log.open()
+        self._finalizer = weakref.finalize(self, self._log.close)
+        
+    def close(self):
+        """Persiste las marcas diferidas pendientes y cierra el log."""
+        self._finalizer()
+        self._dirty = False
+    
+    def _today(self):
+        """Fecha de hoy 'YYYY-MM-DD', reformateada solo cuando cambia el día."""
+        d = date.today()
+        if d != self._today_date:
+            self._today_date = d
+            self._today_str = d.isoformat()
+        return self._today_str
+    
+    def _rebuild_indexes(self):
+        """
+        Reconstruye el set de símbolos enviados hoy e invalida las cachés derivadas
+        (frozenset y detalles). El índice hash -> fila vive en TicketStore.
+        """
+        self._sent_symbols = {str(symbol or '') for symbol in self.daily_tickets.symbols}
+        self._sent_symbols_frozen = None
+        self._details_cache = None
+        
+    def _read_records(self):
+        """Lee todos los registros del log. Devuelve (registros, tamaño en bytes)."""
+        with open(self.tracker_file, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            
+            if size > MMAP_THRESHOLD_BYTES:
+                try:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        return _parse_records(iter(mm.readline, b'')), size
+                except (OSError, ValueError):
+                    pass  # Sin mmap en esta plataforma/sistema de archivos: lectura normal
+            
+            return _parse_records(f), size
+    
     def load_daily_tickets(self):
         """Carga tickets enviados del día actual."""
         try:
             if os.path.exists(self.tracker_file):
-                with open(self.tracker_file, 'r') as f:
-                    data = json.load(f)
-                
-                today = datetime.now().strftime('%Y-%m-%d')
-                
-                # Limpiar datos antiguos (mantener solo últimos 3 días)
-                cutoff_date = (datetime.now() - timedelta(days=3)).strftime('%Y-%m-%d')
-                cleaned_data = {}
+                today = self._today()
                 
-                for date, tickets in data.items():
-                    if date >= cutoff_date:
-                        cleaned_data[date] = tickets
+                records, size = self._read_records()
                 
-                # Guardar datos limpiados
-                with open(self.tracker_file, 'w') as f:
-                    json.dump(cleaned_data, f, indent=2)
+                # Compactar el log si creció demasiado (mantener solo últimos 3 días)
+                if size > COMPACT_THRESHOLD_BYTES:
+                    cutoff_date = self._today_date - timedelta(days=3)
+                    kept = [r for r in records if (_record_day(r) or date.min) >= cutoff_date]
+                    
+                    # Reescribir solo si de verdad se purgó algo
+                    if len(kept) < len(records):
+                        self._write_records(kept)
+                    records = kept
                 
-                return cleaned_data.get(today, [])
+                return TicketStore(r for r in records if r.get('timestamp', '')[:10] == today)
             else:
-                return []
+                return TicketStore()
                 
         except Exception as e:
             print(f"⚠️ Error cargando tickets: {e}")
-            return []
+            return TicketStore()
     
     def save_daily_tickets(self):
-        """Guarda tickets del día actual."""
+        """Reescribe el log con los tickets del día actual (los de otros días se conservan)."""
         try:
-            # Cargar datos existentes
-            if os.path.exists(self.tracker_file):
-                with open(self.tracker_file, 'r') as f:
-                    data = json.load(f)
-            else:
-                data = {}
+            today = self._today()
             
-            # Actualizar día actual
-            today = datetime.now().strftime('%Y-%m-%d')
-            data[today] = self.daily_tickets
+            # Cargar registros de otros días
+            records = []
+            if os.path.exists(self.tracker_file):
+                records, _ = self._read_records()
+            records = [r for r in records if r.get('timestamp', '')[:10] != today]
+            records.extend(self.daily_tickets)
             
-            # Guardar
-            with open(self.tracker_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            # Guardar (incluye cualquier marca diferida pendiente)
+            self._write_records(records)
+            self._log.pending.clear()
+            self._dirty = False
                 
         except Exception as e:
             print(f"⚠️ Error guardando tickets: {e}")
     
+    def _write_records(self, records):
+        """
+        Reescribe el log completo: serializa en memoria y escribe en una sola llamada.
+        Escribe a .tmp y lo renombra encima: un corte a mitad nunca deja el log truncado.
+        """
+        payload = b''.join(_dumps(record) + b'\n' for record in records)
+        tmp_path = self.tracker_file + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp_path, self.tracker_file)
+        
+        # El handle de append apuntaba al archivo reemplazado
+        if self._log.fh is not None:
+            self._log.open()
+    
+    def _append_records(self, records):
+        """Añade tickets al log en una sola escritura."""
+        self._log.write(records)
+    
+    def flush(self):
+        """Escribe de una vez las marcas pendientes del modo diferido."""
+        if self._dirty:
+            self._log.flush()
+            self._dirty = False
+    
     def generate_ticket_hash(self, symbol, option_type, strike, expiry_date):
         """Genera hash único para un ticket."""
-        ticket_string = f"{symbol}_{option_type}_{strike}_{expiry_date}"
-        return hashlib.md5(ticket_string.encode()).hexdigest()[:8]
+        # typed=True: 150 y 150.0 dan strings distintos, así que no deben compartir entrada
+        return _ticket_hash(symbol, option_type, strike, expiry_date)
     
     def is_ticket_already_sent(self, symbol, option_type, strike, expiry_date):
         """Verifica si un ticket ya fue enviado hoy."""
         ticket_hash = self.generate_ticket_hash(symbol, option_type, strike, expiry_date)
-        
-        for sent_ticket in self.daily_tickets:
-            if sent_ticket.get('hash') == ticket_hash:
-                return True, sent_ticket.get('sent_time', 'unknown')
-        
-        return False, None
+        sent_time = self.daily_tickets.sent_time_of(ticket_hash)
+        return sent_time is not None, sent_time
     
-    def mark_ticket_as_sent(self, symbol, option_type, strike, expiry_date, additional_data=None):
-        """Marca un ticket como enviado."""
+    def _record_ticket(self, symbol, option_type, strike, expiry_date, additional_data=None):
+        """
+        Registra un ticket en memoria (sin tocar disco).
+        Devuelve (hash, registro); registro es None si ese ticket ya estaba marcado hoy.
+        """
         ticket_hash = self.generate_ticket_hash(symbol, option_type, strike, expiry_date)
+        if ticket_hash in self.daily_tickets:
+            return ticket_hash, None
+        
+        now = datetime.now()
         
         ticket_record = {
             'hash': ticket_hash,
@@ -89,25 +343,74 @@ class TicketTracker:
             'option_type': option_type,
             'strike': strike,
             'expiry_date': expiry_date,
-            'sent_time': datetime.now().strftime('%H:%M:%S'),
-            'timestamp': datetime.now().isoformat()
+            'sent_time': now.strftime('%H:%M:%S'),
+            'timestamp': now.isoformat()
         }
         
         if additional_data:
             ticket_record.update(additional_data)
         
         self.daily_tickets.append(ticket_record)
-        self.save_daily_tickets()
+        self._sent_symbols.add(str(symbol))
+        self._sent_symbols_frozen = None
+        self._details_cache = None
+        
+        return ticket_hash, ticket_record
+    
+    def mark_ticket_as_sent(self, symbol, option_type, strike, expiry_date, additional_data=None):
+        """Marca un ticket como enviado."""
+        ticket_hash, ticket_record = self._record_ticket(symbol, option_type, strike, expiry_date, additional_data)
+        
+        if ticket_record is None:
+            return ticket_hash  # Ya marcado hoy: idempotente
+        
+        if self.deferred:
+            self._log.pending.append(ticket_record)
+            self._dirty = True
+        else:
+            self._append_records([ticket_record])
         
         return ticket_hash
     
+    def mark_tickets_batch(self, tickets):
+        """
+        Marca varios tickets como enviados con una sola escritura al log
+        (en modo diferido se encolan hasta flush(), igual que mark_ticket_as_sent).
+        Cada ticket es un dict con symbol, option_type, strike, expiry_date
+        y opcionalmente additional_data. Devuelve la lista de hashes.
+        """
+        hashes = []
+        records = []
+        for t in tickets:
+            ticket_hash, ticket_record = self._record_ticket(
+                t['symbol'], t['option_type'], t['strike'], t['expiry_date'], t.get('additional_data'))
+            hashes.append(ticket_hash)
+            if ticket_record is not None:  # Los ya marcados no se vuelven a escribir
+                records.append(ticket_record)
+        
+        if records:
+            if self.deferred:
+                # Tras las marcas diferidas previas, para conservar el orden en disco
+                self._log.pending.extend(records)
+                self._dirty = True
+            else:
+                self._append_records(records)
+        
+        return hashes
+    
     def get_todays_sent_count(self):
         """Obtiene cantidad de tickets enviados hoy."""
         return len(self.daily_tickets)
     
     def get_sent_symbols_today(self):
         """Obtiene lista de símbolos ya enviados hoy."""
-        return list(set([str(ticket.get('symbol', '')) if isinstance(ticket, dict) else str(ticket) for ticket in self.daily_tickets]))
+        return list(self.get_sent_symbols_set())
+    
+    def get_sent_symbols_set(self):
+        """Símbolos enviados hoy como frozenset (para chequeos 'in'; se cachea hasta la próxima marca)."""
+        if self._sent_symbols_frozen is None:
+            self._sent_symbols_frozen = frozenset(self._sent_symbols)
+        return self._sent_symbols_frozen
     
     def filter_new_opportunities(self, opportunities):
         """
@@ -116,69 +419,72 @@ class TicketTracker:
         Fuerza diversificación - máximo 1 ticket por símbolo por día
         """
         new_opportunities = []
-        sent_symbols_today = self.get_sent_symbols_today()
+        blocked = []
         
-        print(f"🛡️  ANTI-REPETITION GATE: {len(sent_symbols_today)} symbols already sent today: {sent_symbols_today}")
+        if self.verbose:
+            print(f"🛡️  ANTI-REPETITION GATE: {len(self._sent_symbols)} symbols already sent today: {list(self._sent_symbols)}")
         
+        # Un solo paso: el primer candidato de cada símbolo no enviado hoy pasa.
+        # (Un ticket exacto ya enviado implica su símbolo, así que no hace falta
+        # un segundo chequeo por hash.)
+        seen = set(self._sent_symbols)
         for opp in opportunities:
             symbol = opp.get('symbol', '')
-            option_type = opp.get('option_type', '').upper()
-            strike = opp.get('strike', 0)
-            expiry_date = opp.get('expiry_date', '')
             
-            # BLOQUEO CRÍTICO: Si el símbolo ya fue enviado HOY, SKIP completamente
-            if symbol in sent_symbols_today:
-                print(f"🚫 SYMBOL GATE BLOCKED: {symbol} {option_type} ${strike} - Symbol already used today (diversification enforced)")
+            # BLOQUEO CRÍTICO: símbolo ya enviado HOY o repetido en este lote
+            if symbol in seen:
+                blocked.append((symbol, opp.get('option_type', '').upper(), opp.get('strike', 0)))
                 continue
             
-            # Verificar ticket exacto (backup check)
-            is_sent, sent_time = self.is_ticket_already_sent(symbol, option_type, strike, expiry_date)
-            
-            if not is_sent:
-                new_opportunities.append(opp)
-            else:
-                print(f"🔄 EXACT TICKET BLOCKED: {symbol} {option_type} ${strike} - Already sent at {sent_time}")
+            seen.add(symbol)
+            new_opportunities.append(opp)
+        
+        # Persistir marcas diferidas de la ronda anterior
+        if self._dirty:
+            self.flush()
         
         # DIVERSIFICATION REPORT
-        total_blocked = len(opportunities) - len(new_opportunities)
-        if total_blocked > 0:
-            print(f"🎯 DIVERSIFICATION ENFORCED: {total_blocked} opportunities blocked for symbol repetition")
-            print(f"✅ PORTFOLIO DIVERSITY MAINTAINED: {len(new_opportunities)} unique symbols selected")
+        if blocked and self.verbose:
+            print(f"🚫 SYMBOL GATE BLOCKED {len(blocked)}: " + ", ".join(f"{s} {t} ${k}" for s, t, k in blocked[:20])
+                  + f"\n🎯 DIVERSIFICATION ENFORCED: {len(blocked)} opportunities blocked for symbol repetition"
+                  + f"\n✅ PORTFOLIO DIVERSITY MAINTAINED: {len(new_opportunities)} unique symbols selected")
         
         return new_opportunities
     
     def get_sent_symbols_today_with_details(self):
-        """Obtiene símbolos enviados hoy con detalles completos para exclusión."""
-        sent_details = []
-        
-        for ticket in self.daily_tickets:
-            sent_details.append({
-                'symbol': ticket['symbol'],
-                'option_type': ticket['option_type'],
-                'strike': ticket['strike'],
-                'expiry_date': ticket['expiry_date'],
-                'sent_time': ticket['sent_time'],
-                'hash': ticket['hash']
-            })
+        """
+        Obtiene símbolos enviados hoy con detalles completos para exclusión.
+        La proyección se cachea hasta la próxima marca; cada llamada devuelve
+        dicts nuevos, así modificarlos no afecta la caché.
+        """
+        if self._details_cache is not None:
+            return [dict(row) for row in self._details_cache]
         
-        return sent_details
+        store = self.daily_tickets
+        self._details_cache = tuple(
+            {
+                'symbol': symbol,
+                'option_type': option_type,
+                'strike': strike,
+                'expiry_date': expiry_date,
+                'sent_time': sent_time,
+                'hash': ticket_hash
+            }
+            for symbol, option_type, strike, expiry_date, sent_time, ticket_hash in zip(
+                store.symbols, store.option_types, store.strikes,
+                store.expiry_dates, store.sent_times, store.hashes)
+        )
+        return [dict(row) for row in self._details_cache]
     
     def should_skip_symbol_analysis(self, symbol):
         """
         BLOQUEO PREVENTIVO DE ANÁLISIS - Evita repeticiones desde el origen
         Si un símbolo ya fue enviado HOY, NO lo analices para forzar diversificación
         """
-        sent_symbols_today = self.get_sent_symbols_today()
-        
         # BLOQUEO CRÍTICO: Si el símbolo ya fue usado HOY, SKIP análisis completamente
-        if symbol in sent_symbols_today:
+        if symbol in self._sent_symbols:
             return True, f"Symbol {symbol} already sent today - DIVERSIFICATION ENFORCED"
         
-        # Backup: Si se enviaron múltiples tickets para este símbolo (edge case)
-        symbol_tickets = [t for t in self.daily_tickets if t['symbol'] == symbol]
-        if len(symbol_tickets) >= 1:  # Cambiado de 3 a 1 para máxima restricción
-            return True, f"Symbol {symbol} already used - PORTFOLIO DIVERSITY PRIORITY"
-        
         return False, None
     
     def get_daily_stats(self):
@@ -186,18 +492,19 @@ class TicketTracker:
         today_symbols = self.get_sent_symbols_today()
         
         stats = {
-            'date': datetime.now().strftime('%Y-%m-%d'),
+            'date': self._today(),
             'total_sent': self.get_todays_sent_count(),
             'unique_symbols': len(today_symbols),
             'symbols_sent': today_symbols,
-            'last_sent': self.daily_tickets[-1]['sent_time'] if self.daily_tickets else None
+            'last_sent': self.daily_tickets.sent_times[-1] if self.daily_tickets else None
         }
         
         return stats
     
     def clear_today_tickets(self):
         """Limpia tickets del día (para testing)."""
-        self.daily_tickets = []
+        self.daily_tickets = TicketStore()
+        self._rebuild_indexes()
         self.save_daily_tickets()
         print("🧹 Tickets del día limpiados")
     
@@ -208,7 +515,7 @@ class TicketTracker:
         """
         sent_symbols_today = self.get_sent_symbols_today()
         
-        if sent_symbols_today:
+        if sent_symbols_today and self.verbose:
             print(f"🚫 EXCLUSION LIST FOR SCANNER: {len(sent_symbols_today)} symbols to skip: {sent_symbols_today}")
         
         return sent_symbols_today
@@ -219,17 +526,22 @@ class TicketTracker:
         Input: Lista de símbolos candidatos
         Output: Lista filtrada sin símbolos ya enviados hoy
         """
-        sent_symbols_today = self.get_sent_symbols_today()
-        
-        # Filtrar símbolos que ya fueron enviados
-        diversified_symbols = [symbol for symbol in candidate_symbols if symbol not in sent_symbols_today]
+        sent_symbols_today = self.get_sent_symbols_set()
         
-        removed_count = len(candidate_symbols) - len(diversified_symbols)
+        # Filtrar símbolos que ya fueron enviados: un solo paso separa conservados
+        # y removidos (candidate_symbols puede ser un iterable de una sola pasada)
+        diversified_symbols = []
+        removed_symbols = []
+        for symbol in candidate_symbols:
+            if symbol in sent_symbols_today:
+                removed_symbols.append(symbol)
+            else:
+                diversified_symbols.append(symbol)
         
-        if removed_count > 0:
-            print(f"🎯 PORTFOLIO DIVERSIFICATION: {removed_count} symbols removed for repetition")
-            print(f"   Removed symbols: {[s for s in candidate_symbols if s in sent_symbols_today]}")
-            print(f"✅ Diversified symbols: {len(diversified_symbols)} unique candidates")
+        if removed_symbols and self.verbose:
+            print(f"🎯 PORTFOLIO DIVERSIFICATION: {len(removed_symbols)} symbols removed for repetition"
+                  + f"\n   Removed symbols: {removed_symbols}"
+                  + f"\n✅ Diversified symbols: {len(diversified_symbols)} unique candidates")
         
         return diversified_symbols
 